@@ -0,0 +1,90 @@
+# autoscale.py
+# Autoskaler neuronów – budżet w bajtach na tablice tego procesu, zmiany paczkami z histerezą
+
+import math
+
+import numpy as np
+
+# ─── Constants ──────────────────────────────────────────────────────────────
+LOW_WATER        = 0.75
+HIGH_WATER       = 0.95
+GROW_BATCH       = 0.25
+MIN_BATCH        = 8
+COOLDOWN_CYCLES  = 20
+
+
+def neurons_for_bytes(budget, itemsize):
+    # Largest n with n² weights + n activations fitting in `budget` bytes
+    if budget <= 0:
+        return 0
+    return int((math.sqrt(1 + 4*budget/itemsize) - 1) / 2)
+
+
+def weakest_neurons(weights, k):
+    # Least-connected = smallest total |w| in and out
+    strength = np.abs(weights).sum(axis=0) + np.abs(weights).sum(axis=1)
+    k = min(k, strength.size)
+    return np.argpartition(strength, k-1)[:k] if k > 0 else np.empty(0, dtype=np.intp)
+
+
+class Autoscaler:
+    # Grows below LOW_WATER of the budget, shrinks above HIGH_WATER, does nothing in between;
+    # after any resize it waits `cooldown` cycles so the size settles instead of flapping
+    def __init__(self, budget, min_neurons=1, max_neurons=None, low=LOW_WATER, high=HIGH_WATER,
+                 batch=GROW_BATCH, min_batch=MIN_BATCH, cooldown=COOLDOWN_CYCLES):
+        if not 0 < low < high <= 1:
+            raise ValueError(f"Złe progi autoskalera: low={low} high={high}")
+        self.budget      = int(budget)
+        self.min_neurons = min_neurons
+        self.max_neurons = max_neurons
+        self.low         = low
+        self.high        = high
+        self.batch       = batch
+        self.min_batch   = min_batch
+        self.cooldown    = cooldown
+        self.grown       = 0
+        self.pruned      = 0
+        self._next       = 0
+        self._limits     = {}
+
+    def limits(self, itemsize):
+        # (n at low water, n at high water, n that fills the whole budget); called every cycle,
+        # so cached until the budget or the cap changes
+        key = (itemsize, self.budget, self.max_neurons, self.low, self.high)
+        lim = self._limits.get(key)
+        if lim is None:
+            lim = self._limits[key] = self._compute_limits(itemsize)
+        return lim
+
+    def _compute_limits(self, itemsize):
+        lo   = neurons_for_bytes(self.budget*self.low, itemsize)
+        hi   = neurons_for_bytes(self.budget*self.high, itemsize)
+        full = neurons_for_bytes(self.budget, itemsize)
+        if self.max_neurons is not None:
+            lo, hi, full = min(lo, self.max_neurons), min(hi, self.max_neurons), min(full, self.max_neurons)
+        return lo, hi, full
+
+    def decide(self, n, itemsize, cycle):
+        # Neurons to add (>0) or remove (<0) this cycle
+        if cycle < self._next:
+            return 0
+        lo, hi, _ = self.limits(itemsize)
+        if n < lo:
+            return min(max(self.min_batch, int(n*self.batch)), hi - n)
+        if n > hi:
+            # Back to the middle of the band, so the next small drift does not trigger again
+            return min(0, max((lo + hi)//2, self.min_neurons) - n)
+        return 0
+
+    def step(self, store, cycle):
+        delta = self.decide(store.n, store.dtype.itemsize, cycle)
+        if delta > 0:
+            store.grow(delta, max_capacity=self.limits(store.dtype.itemsize)[2])
+            self.grown += delta
+        elif delta < 0:
+            store.remove(weakest_neurons(store.weights, -delta))
+            store.compact(self.limits(store.dtype.itemsize)[2])
+            self.pruned -= delta
+        if delta:
+            self._next = cycle + self.cooldown
+        return delta
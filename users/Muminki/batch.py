@@ -0,0 +1,170 @@
+# batch.py
+# Wiele światów naraz – K Muminków jako stos tablic NumPy, jeden krok dla wszystkich
+
+import argparse
+import itertools
+import time
+
+import numpy as np
+
+from autoscale import neurons_for_bytes
+from engine import (GRID_SIZE, INITIAL_NEURONS, LEARNING_RATE, MUTATION_RATE,
+                    MAX_RAM_USAGE, MUTATION_CYCLE, GROW_PROB, fire_threshold, forward, grow_world)
+from maintenance import CLIP
+
+# ─── Constants ──────────────────────────────────────────────────────────────
+EXPAND_CHANCE    = 0.2
+EVOLVE_CHANCE    = 0.2
+CAPACITY_FACTOR  = 4
+# Same ranges mutate_code() draws from in the muminek variants
+LEARNING_RANGE   = (0.001, 0.05)
+MUTATION_RANGE   = (0.01, 0.2)
+RAM_RANGE        = (0.2, 0.8)
+
+
+# ─── Batch engine ───────────────────────────────────────────────────────────
+class BatchEngine:
+    def __init__(self, learning_rates=LEARNING_RATE, mutation_rates=MUTATION_RATE, max_ram_usages=MAX_RAM_USAGE,
+                 grid_size=GRID_SIZE, neurons=INITIAL_NEURONS, max_neurons=None,
+                 grow=True, seed=None, dtype=float):
+        self.learning_rates = np.atleast_1d(np.asarray(learning_rates, dtype=float))
+        k = self.learning_rates.size
+        self.mutation_rates = np.broadcast_to(np.asarray(mutation_rates, dtype=float), (k,)).copy()
+        self.max_ram_usages = np.broadcast_to(np.asarray(max_ram_usages, dtype=float), (k,)).copy()
+        self.k           = k
+        self.grid_size   = grid_size
+        self.grow        = grow
+        self.rng         = np.random.default_rng(seed)
+
+        # Every world shares one capacity; n_active says how many neurons each one uses.
+        # By default there is room to grow to CAPACITY_FACTOR × neurons.
+        cap = max(neurons, max_neurons or CAPACITY_FACTOR*neurons)
+        self.worlds               = self.rng.random((k, grid_size, grid_size)) < 0.1
+        self.weights              = np.zeros((k, cap, cap), dtype=dtype)
+        self.weights[:, :neurons, :neurons] = self.rng.standard_normal((k, neurons, neurons)) * 0.01
+        self.previous_activations = np.zeros((k, cap), dtype=dtype)
+        self.n_active             = np.full(k, neurons)
+        # As in Engine, max_ram_usage is a share of a memory pool, here the bytes of one world
+        # at full capacity: each world grows until its share is used
+        pool = (cap*cap + cap) * self.weights.itemsize
+        self.max_active           = np.array([max(neurons, min(cap, neurons_for_bytes(r*pool, self.weights.itemsize)))
+                                              for r in self.max_ram_usages])
+        self.joy_sum              = np.zeros(k)
+        self.cycle_counter        = 0
+        self.mutations_count      = 0
+
+    @property
+    def capacity(self):
+        return self.weights.shape[1]
+
+    def alive(self):
+        return np.arange(self.capacity) < self.n_active[:, None]
+
+    # ─── Pipeline ───────────────────────────────────────────────────────────
+    def step(self):
+        k, cap = self.k, self.capacity
+        alive  = self.alive()
+        flat   = self.worlds.reshape(k, -1)
+        m      = min(cap, flat.shape[1])
+
+        x = 0.5 * self.previous_activations
+        x[:, :m] += 0.5 * flat[:, :m]
+        # Dead neurons have zero rows and columns, so the batched matmul needs no extra mask
+        sig = forward(x, self.weights)
+        act = (sig > fire_threshold(sig)) & alive
+        actf = act.astype(self.weights.dtype)
+
+        self.weights += self.learning_rates[:, None, None] * (actf[:, :, None] * actf[:, None, :])
+        np.clip(self.weights, -CLIP, CLIP, out=self.weights)
+        # control_world_by_output: active neurons switch their cell on
+        flat[:, :m] |= act[:, :m]
+        self.joy_sum += actf.sum(axis=1) / self.n_active
+
+        if self.grow:
+            grow_world(self.worlds, mask=self.rng.random(self.worlds.shape) < GROW_PROB, out=self.worlds)
+            evolve = self.rng.random(k) < EVOLVE_CHANCE
+            if evolve.any():
+                sub = self.worlds[evolve]
+                self.worlds[evolve] = grow_world(sub, mask=self.rng.random(sub.shape) < GROW_PROB)
+
+        self.expand_neurons()
+        self.previous_activations = actf
+        self.cycle_counter += 1
+        if self.cycle_counter % MUTATION_CYCLE == 0:
+            self.mutate_weights()
+
+    def expand_neurons(self):
+        grow = (self.rng.random(self.k) < EXPAND_CHANCE) & (self.n_active < self.max_active)
+        for i in np.flatnonzero(grow):
+            n = self.n_active[i]
+            self.weights[i, n, :n+1] = 0.01
+            self.weights[i, :n, n]   = 0.01
+            self.n_active[i] = n + 1
+
+    def mutate_weights(self):
+        alive = self.alive()
+        noise = self.rng.standard_normal(self.weights.shape) * self.mutation_rates[:, None, None]
+        noise *= alive[:, :, None] & alive[:, None, :]
+        self.weights += noise
+        self.mutations_count += 1
+
+    def run(self, cycles):
+        for _ in range(cycles):
+            self.step()
+
+    def results(self):
+        cycles = max(self.cycle_counter, 1)
+        return [{
+            "learning_rate": float(self.learning_rates[i]),
+            "mutation_rate": float(self.mutation_rates[i]),
+            "max_ram_usage": float(self.max_ram_usages[i]),
+            "neurons": int(self.n_active[i]),
+            "joy": float(self.joy_sum[i] / cycles),
+            "life": float(self.worlds[i].mean()),
+        } for i in range(self.k)]
+
+
+# ─── Sweeps ─────────────────────────────────────────────────────────────────
+def sweep(learning_rates, mutation_rates=(MUTATION_RATE,), max_ram_usages=(MAX_RAM_USAGE,),
+          cycles=1000, **kwargs):
+    grid = list(itertools.product(learning_rates, mutation_rates, max_ram_usages))
+    lr, mr, ram = (np.array(col) for col in zip(*grid))
+    batch = BatchEngine(lr, mr, ram, **kwargs)
+    batch.run(cycles)
+    return batch.results()
+
+def random_sweep(worlds, cycles=1000, seed=None, **kwargs):
+    rng = np.random.default_rng(seed)
+    batch = BatchEngine(rng.uniform(*LEARNING_RANGE, worlds),
+                        rng.uniform(*MUTATION_RANGE, worlds),
+                        rng.uniform(*RAM_RANGE, worlds), seed=seed, **kwargs)
+    batch.run(cycles)
+    return batch.results()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Przegląd parametrów – wiele światów Muminków w jednym procesie")
+    ap.add_argument("--worlds",  type=int, default=100)
+    ap.add_argument("--cycles",  type=int, default=1000)
+    ap.add_argument("--grid",    type=int, default=GRID_SIZE)
+    ap.add_argument("--neurons", type=int, default=INITIAL_NEURONS)
+    ap.add_argument("--max-neurons", type=int, default=None)
+    ap.add_argument("--seed",    type=int, default=None)
+    ap.add_argument("--dtype",   choices=("float64", "float32"), default="float64")
+    ap.add_argument("--top",     type=int, default=10)
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    res = random_sweep(args.worlds, args.cycles, seed=args.seed, grid_size=args.grid,
+                       neurons=args.neurons, max_neurons=args.max_neurons, dtype=args.dtype)
+    dt = time.perf_counter() - t0
+    print(f"Światy: {args.worlds}  Cykle: {args.cycles}  Czas: {dt:.2f}s  "
+          f"Cykle/s (łącznie): {args.worlds*args.cycles/dt:.0f}")
+    for r in sorted(res, key=lambda r: r["joy"], reverse=True)[:args.top]:
+        print(f"  lr={r['learning_rate']:.5f}  mr={r['mutation_rate']:.5f}  ram={r['max_ram_usage']:.2f}  "
+              f"neurony={r['neurons']}  radość={r['joy']:.3f}  życie={r['life']:.2f}")
+    return res
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+# bench.py
+# Pomiar wydajności – czasy etapów kroku symulacji dla różnych rozmiarów świata i sieci
+#
+#   python bench.py --grids 32,64 --neurons 32,256,1024 --save base.json
+#   python bench.py --grids 32,64 --neurons 32,256,1024 --compare base.json
+
+import argparse
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+
+import numpy as np
+
+from engine import Engine, grow_world
+
+# ─── Constants ──────────────────────────────────────────────────────────────
+BENCH_GRIDS      = (32, 64, 128)
+BENCH_NEURONS    = (32, 256, 1024)
+BENCH_REPEAT     = 7
+BENCH_CYCLES     = 200
+BENCH_ACTIVE     = 0.1
+BENCH_CELL_SIZE  = 8
+REGRESSION       = 0.10
+RESULTS_VERSION  = 1
+
+
+def time_call(fn, repeat=BENCH_REPEAT, budget=0.05):
+    # Seconds per call, median over `repeat` rounds; each round loops until `budget` seconds
+    fn()
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if time.perf_counter() - t0 >= budget or number >= 1 << 16:
+            break
+        number *= 2
+    rounds = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        rounds.append((time.perf_counter() - t0) / number)
+    return statistics.median(rounds)
+
+
+def render_stage(grid_size, cell_size, display=False):
+    # Headless: the frame encoding the dashboard pays (colours + PPM). With a display the real
+    # WorldRenderer.draw, including the PhotoImage upload, is measured instead.
+    try:
+        from renderer import WorldRenderer, frame_rgb, to_ppm
+    except ImportError:
+        return None, None
+    rng    = np.random.default_rng(0)
+    colors = rng.integers(100, 256, (grid_size, grid_size, 3), dtype=np.uint8)
+    worlds = [rng.random((grid_size, grid_size)) < 0.3 for _ in range(2)]
+    state  = {"i": 0}
+
+    def next_world():
+        state["i"] ^= 1
+        return worlds[state["i"]]
+
+    if not display:
+        return (lambda: to_ppm(frame_rgb(next_world(), colors), cell_size)), None
+    import tkinter as tk
+    root     = tk.Tk()
+    canvas   = tk.Canvas(root, width=grid_size*cell_size, height=grid_size*cell_size)
+    canvas.pack()
+    renderer = WorldRenderer(canvas, grid_size, cell_size, seed=0)
+
+    def draw():
+        renderer.draw(next_world())
+        root.update_idletasks()
+    return draw, root.destroy
+
+
+def bench_config(grid_size, neurons, repeat=BENCH_REPEAT, cycles=BENCH_CYCLES, display=False, seed=0):
+    rng = np.random.default_rng(seed)
+    # Peak memory comes from a traced warm-up; tracemalloc slows allocation, so timing runs untraced
+    tracemalloc.start()
+    # max_neurons == neurons keeps N fixed, so every stage is timed at the size asked for
+    eng = Engine(grid_size=grid_size, neurons=neurons, max_neurons=neurons, seed=seed)
+    eng.run(cycles=min(cycles, 10))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    sig = eng.generate_signal().copy()
+    # Hebbian cost depends on how many neurons fire: time the activity the warmed-up engine
+    # actually produces (usually the dense rank-1 path) and a fixed sparse level (the gather path)
+    act    = eng.activate_neurons(sig).copy()
+    sparse = (rng.random(neurons) < BENCH_ACTIVE).astype(eng.neurons.dtype)
+
+    stages = {
+        "generate_signal":       eng.generate_signal,
+        "activate_neurons":      lambda: eng.activate_neurons(sig),
+        "reinforce_connections": lambda: eng.reinforce_connections(act),
+        "reinforce_sparse":      lambda: eng.reinforce_connections(sparse),
+        "mutate_weights":        eng.mutate_weights,
+        "grow_world":            lambda: grow_world(eng.world),
+    }
+    draw, close = render_stage(grid_size, BENCH_CELL_SIZE, display)
+    if draw is not None:
+        stages["update_world_canvas"] = draw
+    try:
+        timings = {name: time_call(fn, repeat) for name, fn in stages.items()}
+    finally:
+        if close is not None:
+            close()
+
+    t0 = time.perf_counter()
+    eng.run(cycles=cycles)
+    elapsed = time.perf_counter() - t0
+    return {
+        "grid": grid_size,
+        "neurons": neurons,
+        "stages": timings,
+        "activity": float(act.mean()),
+        "mean_activity": eng.emotions.mean(cycles),
+        "cycles_per_sec": cycles / elapsed if elapsed else 0.0,
+        "peak_mb": peak / (1024*1024),
+    }
+
+
+def run_suite(grids=BENCH_GRIDS, neurons=BENCH_NEURONS, **kwargs):
+    results = []
+    for g in grids:
+        for n in neurons:
+            res = bench_config(g, n, **kwargs)
+            results.append(res)
+            print(format_result(res))
+    return {
+        "version": RESULTS_VERSION,
+        "created": time.time(),
+        "machine": {"python": platform.python_version(), "numpy": np.__version__,
+                    "platform": platform.platform(), "processor": platform.processor()},
+        "results": results,
+    }
+
+
+def saturated(res):
+    # A network that is silent or fires everywhere has stopped learning anything; its timings
+    # measure the degenerate path, not the simulation
+    mean = res.get("mean_activity")
+    return mean is not None and not 0 < mean < 1
+
+
+def format_result(res):
+    stages = "  ".join(f"{k}={v*1e6:.1f}µs" for k, v in res["stages"].items())
+    return (f"grid={res['grid']:<4} N={res['neurons']:<5} cykle/s={res['cycles_per_sec']:<9.0f} "
+            f"aktywność={res.get('activity', 0):.2f} "
+            f"pamięć={res['peak_mb']:.1f}MB  {stages}" + ("  NASYCENIE" if saturated(res) else ""))
+
+
+# ─── Results ────────────────────────────────────────────────────────────────
+def save_results(path, suite):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(suite, f, indent=2)
+
+def load_results(path):
+    with open(path, "r", encoding="utf-8") as f:
+        suite = json.load(f)
+    if suite.get("version") != RESULTS_VERSION:
+        raise ValueError(f"Nieobsługiwana wersja wyników: {suite.get('version')}")
+    return suite
+
+def compare(old, new, threshold=REGRESSION):
+    # Relative change per stage (+ = slower) for configurations present in both runs
+    base = {(r["grid"], r["neurons"]): r for r in old["results"]}
+    rows = []
+    for r in new["results"]:
+        o = base.get((r["grid"], r["neurons"]))
+        if o is None:
+            continue
+        metrics = dict(r["stages"])
+        before  = dict(o["stages"])
+        # Throughput: express as seconds per cycle so "higher = slower" holds for every row
+        metrics["cycle"] = 1 / r["cycles_per_sec"] if r["cycles_per_sec"] else float("inf")
+        before["cycle"]  = 1 / o["cycles_per_sec"] if o["cycles_per_sec"] else float("inf")
+        metrics["peak_mb"], before["peak_mb"] = r["peak_mb"], o["peak_mb"]
+        for name, value in metrics.items():
+            if name not in before or not before[name]:
+                continue
+            change = value / before[name] - 1
+            rows.append({"grid": r["grid"], "neurons": r["neurons"], "metric": name,
+                         "before": before[name], "after": value, "change": change,
+                         "regression": change > threshold})
+    return rows
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark kroku symulacji Muminków")
+    ap.add_argument("--grids",     default=",".join(map(str, BENCH_GRIDS)))
+    ap.add_argument("--neurons",   default=",".join(map(str, BENCH_NEURONS)))
+    ap.add_argument("--repeat",    type=int,   default=BENCH_REPEAT)
+    ap.add_argument("--cycles",    type=int,   default=BENCH_CYCLES, help="cykle pełnego kroku na konfigurację")
+    ap.add_argument("--display",   action="store_true", help="mierz prawdziwe rysowanie w oknie Tk")
+    ap.add_argument("--save",      default=None, help="zapisz wyniki do pliku JSON")
+    ap.add_argument("--compare",   default=None, help="porównaj z wcześniejszym plikiem JSON")
+    ap.add_argument("--threshold", type=float, default=REGRESSION, help="próg regresji (0.1 = 10% wolniej)")
+    args = ap.parse_args(argv)
+
+    suite = run_suite([int(g) for g in args.grids.split(",")], [int(n) for n in args.neurons.split(",")],
+                      repeat=args.repeat, cycles=args.cycles, display=args.display)
+    if args.save:
+        save_results(args.save, suite)
+    status = 1 if any(saturated(r) for r in suite["results"]) else 0
+    if args.compare:
+        rows = compare(load_results(args.compare), suite, args.threshold)
+        for row in rows:
+            flag = "REGRESJA" if row["regression"] else ""
+            print(f"grid={row['grid']:<4} N={row['neurons']:<5} {row['metric']:<22} "
+                  f"{row['change']*100:+7.1f}%  {flag}")
+        if any(row["regression"] for row in rows):
+            return 1
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
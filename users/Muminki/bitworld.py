@@ -0,0 +1,129 @@
+# bitworld.py
+# Świat upakowany bitowo – osiem komórek w bajcie, statystyki przez popcount zamiast skanowania
+#
+# Rows are packed like np.packbits(world, axis=-1) (big-endian bit order, the same layout the
+# snapshot format stores), so saving a packed world needs no conversion.
+
+import numpy as np
+
+# ─── Constants ──────────────────────────────────────────────────────────────
+CHUNK_CELLS      = 1 << 22
+POPCOUNT_LUT     = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount(bits, axis=None):
+    if hasattr(np, "bitwise_count"):
+        counts = np.bitwise_count(bits)
+    else:
+        counts = POPCOUNT_LUT[bits]
+    return counts.sum(axis=axis, dtype=np.int64)
+
+
+class BitWorld:
+    def __init__(self, bits, size):
+        self.bits = bits
+        self.size = size
+        # Bits past the last column in each row's final byte must stay zero
+        self._tail = np.uint8((0xFF << (-size % 8)) & 0xFF)
+
+    @classmethod
+    def from_bool(cls, world):
+        world = np.asarray(world, dtype=bool)
+        return cls(np.packbits(world, axis=-1), world.shape[-1])
+
+    @classmethod
+    def random(cls, size, density, rng=None, chunk=CHUNK_CELLS):
+        # 16-bit integer draws instead of float64 (¼ of the bytes, 1/65536 resolution);
+        # row chunks keep the temporary bounded for very large grids
+        draw  = np.random.randint if rng is None else rng.integers
+        limit = int(round(density * 65536))
+        bits  = np.empty((size, (size + 7)//8), dtype=np.uint8)
+        rows  = max(1, chunk // size)
+        for r in range(0, size, rows):
+            sample = draw(0, 65536, (min(rows, size-r), size), dtype=np.uint16)
+            bits[r:r+rows] = np.packbits(sample < limit, axis=-1)
+        return cls(bits, size)
+
+    # ─── Array protocol ─────────────────────────────────────────────────────
+    @property
+    def shape(self):
+        return (self.bits.shape[0], self.size)
+
+    @property
+    def nbytes(self):
+        return self.bits.nbytes
+
+    def to_bool(self):
+        return np.unpackbits(self.bits, axis=-1, count=self.size).astype(bool)
+
+    def __array__(self, dtype=None, copy=None):
+        arr = self.to_bool()
+        return arr if dtype is None else arr.astype(dtype)
+
+    def copy(self):
+        return BitWorld(self.bits.copy(), self.size)
+
+    def __getitem__(self, key):
+        y, x = key
+        return bool(self.bits[y, x >> 3] & (0x80 >> (x & 7)))
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice) and key == slice(None):
+            src = value.bits if isinstance(value, BitWorld) else np.packbits(np.asarray(value, dtype=bool), axis=-1)
+            self.bits[:] = src
+            return
+        y, x = key
+        bit = np.uint8(0x80 >> (x & 7))
+        if value:
+            self.bits[y, x >> 3] |= bit
+        else:
+            self.bits[y, x >> 3] &= ~bit
+
+    # ─── Statistics ─────────────────────────────────────────────────────────
+    def count(self):
+        return int(popcount(self.bits))
+
+    def row_counts(self):
+        return popcount(self.bits, axis=-1)
+
+    def density(self):
+        return self.count() / (self.shape[0] * self.size)
+
+    def head(self, n):
+        # First n cells in row-major order as 0/1 bytes; only the rows that hold them are unpacked
+        rows = min(self.shape[0], -(-n // self.size))
+        return np.unpackbits(self.bits[:rows], axis=-1, count=self.size).ravel()[:n]
+
+    def or_head(self, values):
+        # Switch on the first n cells (row-major) where values is true
+        n    = values.size
+        rows = min(self.shape[0], -(-n // self.size))
+        full = np.zeros(rows*self.size, dtype=bool)
+        full[:n] = values
+        self.bits[:rows] |= np.packbits(full.reshape(rows, self.size), axis=-1)
+
+    # ─── Growth ─────────────────────────────────────────────────────────────
+    def dilate(self, seeds):
+        # 3×3 neighbourhood of the packed seeds: rows first, then bits across byte borders
+        grown = seeds.copy()
+        grown[1:]  |= seeds[:-1]
+        grown[:-1] |= seeds[1:]
+        rows = grown.copy()
+        grown |= rows >> 1
+        grown[:, 1:] |= (rows[:, :-1] & 1) << 7
+        grown |= rows << 1
+        grown[:, :-1] |= rows[:, 1:] >> 7
+        grown[:, -1] &= self._tail
+        return grown
+
+    def grow(self, p, mask=None, out=None, rng=None, chunk=CHUNK_CELLS):
+        # Same rule as engine.grow_world, on packed rows; mask may be a bool grid or a BitWorld
+        if mask is None:
+            mask = BitWorld.random(self.size, p, rng, chunk)
+        elif not isinstance(mask, BitWorld):
+            mask = BitWorld.from_bool(mask)
+        grown = self.dilate(self.bits & mask.bits)
+        if out is None:
+            out = BitWorld(self.bits.copy(), self.size)
+        np.bitwise_or(self.bits, grown, out=out.bits)
+        return out
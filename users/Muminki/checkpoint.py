@@ -0,0 +1,131 @@
+# checkpoint.py
+# Zapisy w tle – wątek piszący snapshoty atomowo, z przyrostowym zapisem zmienionych wag
+
+import os
+import queue
+import threading
+
+import numpy as np
+
+from snapshot import save_snapshot, load_snapshot, read_header, pack_world, unpack_world
+
+# ─── Constants ──────────────────────────────────────────────────────────────
+BLOCK_ROWS       = 64
+# Above this fraction of changed rows a full snapshot is cheaper than a delta
+FULL_FRACTION    = 0.5
+DELTA_SUFFIX     = ".delta.npz"
+
+
+def delta_path(path):
+    return path + DELTA_SUFFIX
+
+def changed_rows(old, new, block=BLOCK_ROWS):
+    # Rows are compared in bands of `block`; a band is written whole if any value in it moved
+    n = new.shape[0]
+    bands = np.flatnonzero(np.add.reduceat((old != new).any(axis=1), np.arange(0, n, block)))
+    if bands.size == 0:
+        return np.zeros(0, dtype=np.intp)
+    return np.concatenate([np.arange(b*block, min((b+1)*block, n)) for b in bands])
+
+
+class CheckpointWriter:
+    def __init__(self, path, incremental=True, block=BLOCK_ROWS, verbose=True):
+        self.path        = path
+        self.incremental = incremental
+        self.block       = block
+        self.verbose     = verbose
+        self.written     = 0
+        self.bytes       = 0
+        self.error       = None
+        # Latest snapshot wins: if the writer is busy, a newer one replaces the queued one
+        self._queue      = queue.Queue(maxsize=1)
+        self._idle       = threading.Event()
+        self._idle.set()
+        self._base       = None
+        self._base_cycle = None
+        self._thread     = None
+        self._lock       = threading.Lock()
+
+    def submit(self, state):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._worker, daemon=True)
+                self._thread.start()
+            self._idle.clear()
+            try:
+                self._queue.get_nowait()
+                self._queue.task_done()
+            except queue.Empty:
+                pass
+            self._queue.put_nowait(state)
+
+    def flush(self, timeout=None):
+        return self._idle.wait(timeout)
+
+    def _worker(self):
+        while True:
+            state = self._queue.get()
+            try:
+                self.write(state)
+            except Exception as e:
+                self.error = e
+                print(f"Błąd zapisu: {e}")
+            finally:
+                self._queue.task_done()
+                with self._lock:
+                    if self._queue.unfinished_tasks == 0:
+                        self._idle.set()
+
+    # ─── Writing ────────────────────────────────────────────────────────────
+    def write(self, state):
+        w = state["weights"]
+        rows = None
+        if self.incremental and self._base is not None and self._base.shape == w.shape:
+            rows = changed_rows(self._base, w, self.block)
+            if rows.size > FULL_FRACTION * w.shape[0]:
+                rows = None
+        if rows is None:
+            save_snapshot(self.path, **state)
+            self._base = w
+            self._base_cycle = int(state["cycle_counter"])
+            if os.path.exists(delta_path(self.path)):
+                os.remove(delta_path(self.path))
+            size = os.path.getsize(self.path)
+        else:
+            size = self.write_delta(state, rows)
+        self.written += 1
+        self.bytes   += size
+        if self.verbose:
+            print("Stan zapisany.")
+
+    def write_delta(self, state, rows):
+        # Deltas are cumulative against the base snapshot, so only one file is ever needed
+        dpath = delta_path(self.path)
+        tmp = dpath + ".tmp.npz"
+        np.savez(tmp,
+                 base_cycle=np.int64(self._base_cycle),
+                 cycle_counter=np.int64(state["cycle_counter"]),
+                 world=pack_world(state["world"]),
+                 world_shape=np.array(np.shape(state["world"])),
+                 previous_activations=state["previous_activations"],
+                 rows=rows,
+                 data=state["weights"][rows])
+        os.replace(tmp, dpath)
+        return os.path.getsize(dpath)
+
+
+def load_checkpoint(path, mmap_mode="c"):
+    # mmap_mode must leave weights writable ("c" or None) so the delta can be applied
+    st = load_snapshot(path, mmap_mode=mmap_mode)
+    dpath = delta_path(path)
+    if not os.path.exists(dpath):
+        return st
+    with np.load(dpath, allow_pickle=False) as d:
+        if int(d["base_cycle"]) != read_header(path)["cycle_counter"]:
+            return st
+        if d["rows"].size:
+            st["weights"][d["rows"]] = d["data"]
+        st["world"]                = unpack_world(d["world"], tuple(d["world_shape"]))
+        st["previous_activations"] = np.array(d["previous_activations"])
+        st["cycle_counter"]        = int(d["cycle_counter"])
+    return st
@@ -0,0 +1,156 @@
+# cluster.py
+# Klaster Muminków na jednej maszynie – N węzłów bez okien, wybrana topologia, pomiar przepustowości
+
+import argparse
+import threading
+import time
+
+import numpy as np
+
+from engine import Engine, GRID_SIZE, INITIAL_NEURONS
+from thoughts import ThoughtSender, ThoughtServer, THOUGHT_PORT
+
+# ─── Constants ──────────────────────────────────────────────────────────────
+TOPOLOGIES = ("ring", "full", "star", "random")
+
+
+def topology(kind, n, degree=2, seed=None):
+    if kind == "ring":
+        return [[(i + 1) % n] if n > 1 else [] for i in range(n)]
+    if kind == "full":
+        return [[j for j in range(n) if j != i] for i in range(n)]
+    if kind == "star":
+        return [list(range(1, n))] + [[0] for _ in range(1, n)]
+    if kind == "random":
+        rng = np.random.default_rng(seed)
+        return [sorted(rng.choice([j for j in range(n) if j != i], size=min(degree, n-1), replace=False).tolist())
+                for i in range(n)]
+    raise ValueError(f"Nieznana topologia: {kind}")
+
+
+class LoopbackSender:
+    # Same interface as ThoughtSender, but hands the array straight to the peer engines
+    def __init__(self, name, targets):
+        self.name    = name
+        self.targets = targets
+        self.sent    = 0
+
+    def broadcast(self, arr):
+        # Peers keep the array until their next cycle, while the sender reuses its step buffers
+        arr = arr.copy()
+        for eng in self.targets:
+            eng.receive_thought(arr, self.name)
+        self.sent += len(self.targets)
+        return len(self.targets)
+
+    def close(self):
+        pass
+
+
+# ─── Cluster ────────────────────────────────────────────────────────────────
+class Cluster:
+    def __init__(self, nodes, kind="ring", transport="loopback", degree=2, base_port=THOUGHT_PORT,
+                 grid_size=GRID_SIZE, neurons=INITIAL_NEURONS, max_neurons=None, seed=None, **engine_kwargs):
+        self.kind      = kind
+        self.transport = transport
+        self.links     = topology(kind, nodes, degree, seed)
+        self.servers   = []
+        self.engines   = [Engine(grid_size=grid_size, neurons=neurons, max_neurons=max_neurons,
+                                 state_file=f"world_state_{i}.mum",
+                                 seed=None if seed is None else [seed, i], **engine_kwargs)
+                          for i in range(nodes)]
+        if transport == "loopback":
+            for i, eng in enumerate(self.engines):
+                eng.thoughts = LoopbackSender(i, [self.engines[j] for j in self.links[i]])
+        elif transport == "tcp":
+            for i, eng in enumerate(self.engines):
+                self.servers.append(ThoughtServer(eng.receive_thought, host="127.0.0.1", port=base_port + i).start())
+            for i, eng in enumerate(self.engines):
+                eng.thoughts = ThoughtSender([("127.0.0.1", self.servers[j].port) for j in self.links[i]],
+                                             port=self.servers[i].port)
+        else:
+            raise ValueError(f"Nieznany transport: {transport}")
+
+    def run_deterministic(self, cycles):
+        # One thread, nodes stepped round-robin: with a cluster seed and no RAM-driven
+        # growth (max_neurons == neurons) the same seed gives the same run
+        t0 = time.perf_counter()
+        for _ in range(cycles):
+            for eng in self.engines:
+                eng.life_cycle()
+        return time.perf_counter() - t0
+
+    def run_threads(self, seconds):
+        t0 = time.perf_counter()
+        threads = [threading.Thread(target=eng.run, kwargs={"seconds": seconds}, daemon=True)
+                   for eng in self.engines]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return time.perf_counter() - t0
+
+    def report(self, elapsed):
+        cycles   = sum(eng.cycle_counter for eng in self.engines)
+        sent     = sum(self.sent(eng) for eng in self.engines)
+        received = sum(eng.inbox.received for eng in self.engines)
+        return {
+            "nodes": len(self.engines),
+            "topology": self.kind,
+            "transport": self.transport,
+            "seconds": elapsed,
+            "cycles": cycles,
+            "cycles_per_sec": cycles / elapsed if elapsed else 0.0,
+            "messages_sent": sent,
+            "messages_received": received,
+            "messages_per_sec": received / elapsed if elapsed else 0.0,
+            "per_node": [eng.cycle_counter for eng in self.engines],
+        }
+
+    @staticmethod
+    def sent(eng):
+        if isinstance(eng.thoughts, LoopbackSender):
+            return eng.thoughts.sent
+        return sum(link.sent for link in eng.thoughts.links)
+
+    def close(self):
+        for eng in self.engines:
+            eng.thoughts.close()
+        for srv in self.servers:
+            srv.close()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Klaster Muminków bez okien na jednej maszynie")
+    ap.add_argument("--nodes",       type=int,   default=8)
+    ap.add_argument("--topology",    choices=TOPOLOGIES, default="ring")
+    ap.add_argument("--degree",      type=int,   default=2, help="liczba sąsiadów w topologii random")
+    ap.add_argument("--transport",   choices=("loopback", "tcp"), default="loopback")
+    ap.add_argument("--base-port",   type=int,   default=THOUGHT_PORT)
+    ap.add_argument("--seconds",     type=float, default=5)
+    ap.add_argument("--cycles",      type=int,   default=None, help="tryb deterministyczny: tyle cykli na węzeł")
+    ap.add_argument("--seed",        type=int,   default=0)
+    ap.add_argument("--max-neurons", type=int,   default=INITIAL_NEURONS)
+    args = ap.parse_args(argv)
+
+    cl = Cluster(args.nodes, args.topology, args.transport, degree=args.degree, base_port=args.base_port,
+                 max_neurons=args.max_neurons, seed=args.seed)
+    try:
+        if args.cycles is not None:
+            elapsed = cl.run_deterministic(args.cycles)
+        else:
+            elapsed = cl.run_threads(args.seconds)
+        if args.transport == "tcp":
+            time.sleep(0.2)
+        rep = cl.report(elapsed)
+    finally:
+        cl.close()
+    print(f"Węzły: {rep['nodes']}  Topologia: {rep['topology']}  Transport: {rep['transport']}")
+    print(f"Cykle: {rep['cycles']}  Cykle/s: {rep['cycles_per_sec']:.0f}")
+    print(f"Myśli wysłane: {rep['messages_sent']}  odebrane: {rep['messages_received']}  "
+          f"na sekundę: {rep['messages_per_sec']:.0f}")
+    return rep
+
+
+if __name__ == "__main__":
+    main()
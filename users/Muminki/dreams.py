@@ -0,0 +1,198 @@
+# dreams.py
+# Korpus marzeń – strony pobrane raz, oczyszczone i trzymane na dysku jako tablice linii
+#
+# Each source is cached as <key>.lines.npy (UTF-8 bytes), <key>.offsets.npy (line starts)
+# and <key>.json (url, ETag, Last-Modified, fetch time). The arrays are read into memory, not
+# mapped: refresh and eviction replace or delete these files, which Windows refuses while a
+# mapping of them is open.
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+
+import numpy as np
+import requests
+from bs4 import BeautifulSoup
+
+# ─── Constants ──────────────────────────────────────────────────────────────
+CORPUS_FOLDER    = os.path.join("muminki_dreams", "corpus")
+DREAM_TTL        = 24 * 3600
+DREAM_MAX_AGE    = 30 * 24 * 3600
+DREAM_TIMEOUT    = 10
+SNIPPET_LENGTH   = 200
+
+
+def clean_text_from_html(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    for tag in soup(["script","style"]): tag.decompose()
+    text = soup.get_text()
+    lines = (ln.strip() for ln in text.splitlines())
+    chunks = (ph for ln in lines for ph in ln.split("  "))
+    return "\n".join(ch for ch in chunks if ch)
+
+def source_key(source):
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+
+def is_local(source):
+    return source.startswith("file://") or not source.startswith(("http://", "https://"))
+
+
+class DreamLines:
+    def __init__(self, data, offsets):
+        self.data    = data
+        self.offsets = offsets
+
+    @classmethod
+    def from_text(cls, text):
+        lines   = [ln.encode("utf-8") for ln in text.split("\n") if ln]
+        offsets = np.zeros(len(lines) + 1, dtype=np.int64)
+        np.cumsum([len(ln) for ln in lines], out=offsets[1:])
+        return cls(np.frombuffer(b"".join(lines), dtype=np.uint8), offsets)
+
+    def __len__(self):
+        return max(0, self.offsets.size - 1)
+
+    def __getitem__(self, i):
+        return bytes(self.data[self.offsets[i]:self.offsets[i+1]]).decode("utf-8", errors="ignore")
+
+    def choice(self, rng=random):
+        if not len(self):
+            raise IndexError("Brak linii w źródle marzeń")
+        return self[rng.randrange(len(self))]
+
+
+class DreamCorpus:
+    def __init__(self, sources, folder=CORPUS_FOLDER, ttl=DREAM_TTL, max_age=DREAM_MAX_AGE,
+                 timeout=DREAM_TIMEOUT):
+        self.sources = list(sources)
+        self.folder  = folder
+        self.ttl     = ttl
+        self.max_age = max_age
+        self.timeout = timeout
+        self.lines   = {}
+        self.meta    = {}
+        # fetch/store/touch run from the dashboard's task pool and the auto_dreams thread;
+        # they share temp file names, so one source is written by one thread at a time
+        self.lock    = threading.RLock()
+        os.makedirs(folder, exist_ok=True)
+        for src in self.sources:
+            self.load_cached(src)
+
+    # ─── Disk cache ─────────────────────────────────────────────────────────
+    def paths(self, source):
+        base = os.path.join(self.folder, source_key(source))
+        return base + ".lines.npy", base + ".offsets.npy", base + ".json"
+
+    def load_cached(self, source):
+        lp, op, mp = self.paths(source)
+        if not (os.path.exists(lp) and os.path.exists(op) and os.path.exists(mp)):
+            return False
+        with open(mp, "r", encoding="utf-8") as f:
+            self.meta[source] = json.load(f)
+        self.lines[source] = DreamLines(np.load(lp), np.load(op))
+        return True
+
+    def store(self, source, text, etag=None, last_modified=None):
+        lines = DreamLines.from_text(text)
+        lp, op, mp = self.paths(source)
+        with self.lock:
+            for path, arr in ((lp, lines.data), (op, lines.offsets)):
+                tmp = path + ".tmp.npy"
+                np.save(tmp, arr)
+                os.replace(tmp, path)
+            self.touch(source, etag=etag, last_modified=last_modified)
+            self.lines[source] = lines
+
+    def touch(self, source, **meta):
+        with self.lock:
+            m = self.meta.setdefault(source, {"url": source})
+            m.update({k: v for k, v in meta.items() if v is not None})
+            m["fetched_at"] = time.time()
+            with open(self.paths(source)[2], "w", encoding="utf-8") as f:
+                json.dump(m, f)
+
+    def is_fresh(self, source):
+        m = self.meta.get(source)
+        return m is not None and time.time() - m.get("fetched_at", 0) < self.ttl
+
+    def evict(self):
+        # Drop cache files nobody refreshed for max_age, and sources no longer configured.
+        # A 304 only rewrites <key>.json, so a key's age is its newest file, not each file's own.
+        keep = {source_key(s) for s in self.sources}
+        now = time.time()
+        removed = 0
+        with self.lock:
+            files = {}
+            for name in os.listdir(self.folder):
+                files.setdefault(name.split(".", 1)[0], []).append(os.path.join(self.folder, name))
+            for key, paths in files.items():
+                if key in keep and now - max(os.path.getmtime(p) for p in paths) <= self.max_age:
+                    continue
+                for path in paths:
+                    os.remove(path)
+                    removed += 1
+            for src in list(self.lines):
+                if source_key(src) not in keep or not os.path.exists(self.paths(src)[0]):
+                    self.lines.pop(src, None)
+                    self.meta.pop(src, None)
+        return removed
+
+    # ─── Fetching ───────────────────────────────────────────────────────────
+    def fetch(self, source):
+        with self.lock:
+            return self._fetch(source)
+
+    def _fetch(self, source):
+        if is_local(source):
+            path = source[len("file://"):] if source.startswith("file://") else source
+            with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                text = f.read()
+            if path.lower().endswith((".html", ".htm")):
+                text = clean_text_from_html(text)
+            self.store(source, text)
+            return True
+        headers = {}
+        m = self.meta.get(source, {})
+        if source in self.lines:
+            if m.get("etag"):
+                headers["If-None-Match"] = m["etag"]
+            if m.get("last_modified"):
+                headers["If-Modified-Since"] = m["last_modified"]
+        r = requests.get(source, headers=headers, timeout=self.timeout)
+        if r.status_code == 304:
+            self.touch(source)
+            return False
+        r.raise_for_status()
+        self.store(source, clean_text_from_html(r.text),
+                   etag=r.headers.get("ETag"), last_modified=r.headers.get("Last-Modified"))
+        return True
+
+    def refresh(self, force=False):
+        # Revalidate stale sources; an offline source keeps serving its cached lines
+        errors = {}
+        for src in self.sources:
+            if force or not self.is_fresh(src):
+                try:
+                    self.fetch(src)
+                except Exception as e:
+                    errors[src] = e
+        self.evict()
+        return errors
+
+    # ─── Dreaming ───────────────────────────────────────────────────────────
+    def dream(self, rng=random):
+        ready = [s for s in self.sources if len(self.lines.get(s, ()))]
+        if not ready:
+            # Cold cache: blocking fetches until a source yields text, after that everything is
+            # served from memory. Sources that come back empty are skipped.
+            for src in rng.sample(self.sources, len(self.sources)):
+                self.fetch(src)
+                if len(self.lines.get(src, ())):
+                    ready = [src]
+                    break
+            else:
+                raise LookupError("Żadne źródło marzeń nie ma tekstu")
+        return self.lines[rng.choice(ready)].choice(rng)[:SNIPPET_LENGTH]
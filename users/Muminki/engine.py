@@ -0,0 +1,585 @@
+# engine.py
+# Silnik Muminków – symulacja bez Tk (headless), dashboard jest tylko obserwatorem
+
+import argparse
+import os
+import threading
+import time
+import uuid
+
+import numpy as np
+
+from autoscale import Autoscaler
+from bitworld import BitWorld
+from checkpoint import CheckpointWriter, load_checkpoint
+from maintenance import CLIP, DECAY, PRUNE_BELOW, Maintenance
+from metrics import MetricsSampler
+from randstream import RandomStream
+from ringbuffer import RingBuffer
+from store import NeuronStore
+from thoughts import ThoughtInbox, ThoughtSender, ThoughtServer, parse_peers, PEERS_ENV
+
+# ─── Constants ──────────────────────────────────────────────────────────────
+GRID_SIZE        = 32
+INITIAL_NEURONS  = 32
+MAX_RAM_USAGE    = 0.65
+LEARNING_RATE    = 0.02
+MUTATION_RATE    = 0.1
+MUTATION_CYCLE   = 100
+MUMINEK_CYCLE    = 200
+EMOTION_WINDOW   = 4096
+EMOTION_LEVELS   = 3
+GROW_PROB        = 0.3
+INPUT_CHANCE     = 0.7
+STATE_FILE       = "world_state.mum"
+MEMORY_POOL      = 6 * 1024 * 1024
+ROW_BLOCK        = 1 << 16
+FIRE_THRESHOLD   = 0.5
+FIRE_SPREAD      = 1.0
+
+
+# ─── World ──────────────────────────────────────────────────────────────────
+def grow_world(world, p=GROW_PROB, mask=None, out=None):
+    # Every live cell that passes the random mask spreads into its 3×3 neighbourhood.
+    # Works on one G×G world or a stack (..., G, G); pass out=world to grow in place.
+    if isinstance(world, BitWorld):
+        return world.grow(p, mask=mask, out=out)
+    if mask is None:
+        mask = np.random.rand(*world.shape) < p
+    seeds = world & mask
+    grown = seeds.copy()
+    grown[..., 1:, :]  |= seeds[..., :-1, :]
+    grown[..., :-1, :] |= seeds[..., 1:, :]
+    rows = grown.copy()
+    grown[..., :, 1:]  |= rows[..., :, :-1]
+    grown[..., :, :-1] |= rows[..., :, 1:]
+    return np.logical_or(world, grown, out=out)
+
+
+# ─── Activity ───────────────────────────────────────────────────────────────
+def forward(x, weights, out=None):
+    # Residual recurrent step: every neuron keeps its own input and adds what the others send
+    # through weights (w[i, j] is i → j). One BLAS matvec for (N,), batched matmul for (K, N).
+    # The recurrent drive is scaled by 1/√N, so its size does not grow with the network.
+    if x.ndim == 1:
+        out = np.matmul(x, weights, out=out)
+    else:
+        out = np.matmul(x[:, None, :], weights, out=None if out is None else out[:, None, :])
+        out = out.reshape(x.shape)
+    out *= 1 / np.sqrt(max(weights.shape[-1], 1))
+    out += x
+    return out
+
+def fire_threshold(sig):
+    # A neuron fires when its signal is above FIRE_THRESHOLD and FIRE_SPREAD standard
+    # deviations above the mean of its network: a uniformly strong drive cannot make every
+    # neuron fire, so activity stays below 1 however large the weights get. Per row for (K, N).
+    return np.maximum(sig.mean(axis=-1, keepdims=True) + FIRE_SPREAD*sig.std(axis=-1, keepdims=True),
+                      FIRE_THRESHOLD)
+
+def row_blocks(n, block=ROW_BLOCK):
+    # Row ranges whose n-wide slices fit in a `block`-element scratch buffer
+    rows = max(1, block // max(n, 1))
+    for r in range(0, n, rows):
+        yield r, min(r + rows, n)
+
+
+# ─── Learning ───────────────────────────────────────────────────────────────
+def hebbian_update(weights, act, lr=LEARNING_RATE, scratch=None, count=False, bound=None):
+    # Only the active rows/cols change, so cost follows k² active pairs, not N².
+    # Dense arrays are updated in place; scipy.sparse matrices are returned as a new CSR.
+    # With a scratch buffer the dense rank-1 update runs in row blocks instead of an N² temporary.
+    # count=True also returns the change in nonzero weights, counted only where the update wrote.
+    # bound clips the updated weights to ±bound (dense only); clipping never zeroes a weight.
+    idx = np.flatnonzero(act)
+    if idx.size == 0:
+        return (weights, 0) if count else weights
+    a = act[idx]
+    delta = 0
+    if isinstance(weights, np.ndarray):
+        if 2*idx.size > act.size:
+            # Mostly active: one contiguous rank-1 update beats gathering k² scattered entries
+            if scratch is None:
+                if count:
+                    delta -= np.count_nonzero(weights)
+                weights += lr * np.outer(act, act)
+                if bound is not None:
+                    np.clip(weights, -bound, bound, out=weights)
+                if count:
+                    delta += np.count_nonzero(weights)
+                return (weights, delta) if count else weights
+            n = act.size
+            for r0, r1 in row_blocks(n, scratch.size):
+                blk = scratch[:(r1-r0)*n].reshape(r1-r0, n)
+                np.multiply(act[r0:r1, None], act, out=blk)
+                blk *= lr
+                rows = weights[r0:r1]
+                # Counted per block while it is in cache, instead of two full-matrix scans
+                if count:
+                    delta -= np.count_nonzero(rows)
+                rows += blk
+                if bound is not None:
+                    np.clip(rows, -bound, bound, out=rows)
+                if count:
+                    delta += np.count_nonzero(rows)
+            return (weights, delta) if count else weights
+        block = np.ix_(idx, idx)
+        upd   = weights[block]
+        if count:
+            delta -= np.count_nonzero(upd)
+        if np.all(a == 1):
+            upd += lr
+        else:
+            upd += lr * np.outer(a, a)
+        if bound is not None:
+            np.clip(upd, -bound, bound, out=upd)
+        weights[block] = upd
+        if count:
+            delta += np.count_nonzero(upd)
+        return (weights, delta) if count else weights
+    import scipy.sparse as sp
+    rows = np.repeat(idx, idx.size)
+    cols = np.tile(idx, idx.size)
+    update = sp.coo_matrix((lr * np.outer(a, a).ravel(), (rows, cols)), shape=weights.shape)
+    out = (weights + update).tocsr()
+    return (out, out.nnz - weights.nnz) if count else out
+
+
+# ─── Input ──────────────────────────────────────────────────────────────────
+class PendingInput:
+    # Peer mutations summed in payload space, O(payload) per message. Payloads of the
+    # same length tile the matrix identically, so each length costs one pass at apply().
+    def __init__(self):
+        self.sums   = {}
+        self.counts = {}
+
+    def add(self, data, limit=None):
+        # Bytes past `limit` (the number of weights) would only wrap onto weights already
+        # covered, so they are dropped before anything is copied
+        raw = np.ascontiguousarray(data).view(np.uint8).ravel()[:limit]
+        if raw.size == 0:
+            return
+        acc = self.sums.get(raw.size)
+        if acc is None:
+            # Integer sums: 4 bytes per payload byte instead of 8 for float64, and exact
+            self.sums[raw.size]   = raw.astype(np.uint32)
+            self.counts[raw.size] = 1
+        else:
+            acc += raw
+            self.counts[raw.size] += 1
+
+    def apply(self, weights, scale, scratch=None):
+        # weights += Σ (b/255 - 0.5) * scale with the payloads repeated over the matrix, one
+        # row block at a time through `scratch`. Returns (messages applied, change in nonzeros).
+        n = weights.shape[0]
+        if scratch is None:
+            scratch = np.empty(max(ROW_BLOCK, n), dtype=weights.dtype)
+        # Each payload followed by its first `block` values again, so the values of any block
+        # are one slice no matter where in the period it starts
+        tiles = [(np.resize(acc, size + scratch.size), size, 0.5*self.counts[size]*scale)
+                 for size, acc in self.sums.items()]
+        delta = 0
+        for r0, r1 in row_blocks(n, scratch.size):
+            rows = weights[r0:r1]
+            blk  = scratch[:(r1-r0)*n]
+            delta -= np.count_nonzero(rows)
+            for ext, size, offset in tiles:
+                pos = (r0*n) % size
+                np.multiply(ext[pos:pos+blk.size], scale/255.0, out=blk)
+                blk -= offset
+                rows += blk.reshape(r1-r0, n)
+            delta += np.count_nonzero(rows)
+        applied = sum(self.counts.values())
+        self.sums.clear()
+        self.counts.clear()
+        return applied, delta
+
+    def __len__(self):
+        return sum(self.counts.values())
+
+
+class StepBuffers:
+    # Work arrays for one life_cycle, sized to the store's capacity: a steady-state cycle
+    # only writes into them. Rebuilt when the store reallocates.
+    def __init__(self, capacity, dtype, block=ROW_BLOCK):
+        self.capacity = capacity
+        self.x        = np.zeros(capacity, dtype=dtype)
+        self.sig      = np.zeros(capacity, dtype=dtype)
+        self.act      = np.zeros(capacity, dtype=dtype)
+        self.fire     = np.zeros(capacity, dtype=bool)
+        # At least one full row, or row_blocks() would hand out blocks larger than the buffer
+        self.scratch  = np.zeros(max(block, capacity), dtype=dtype)
+
+
+# ─── Engine ─────────────────────────────────────────────────────────────────
+class Engine:
+    def __init__(self, grid_size=GRID_SIZE, neurons=INITIAL_NEURONS,
+                 learning_rate=LEARNING_RATE, mutation_rate=MUTATION_RATE,
+                 max_ram_usage=MAX_RAM_USAGE, max_neurons=None, state_file=STATE_FILE,
+                 population=None, checkpoint_every=None, thoughts=None,
+                 input_interval=None, input_rate=None, memory_budget=None, dtype=float,
+                 packed_world=False, seed=None, mutation_k=None, maintenance=None):
+        self.grid_size       = grid_size
+        self.min_neurons     = neurons
+        self.learning_rate   = learning_rate
+        self.mutation_rate   = mutation_rate
+        # None: every weight gets noise; k: only k sampled connections per mutation
+        self.mutation_k      = mutation_k
+        # Optional Maintenance: scheduled decay, clipping and pruning of weights
+        self.maintenance     = maintenance
+        self.last_maintenance = None
+        self.max_ram_usage   = max_ram_usage
+        self.max_neurons     = max_neurons
+        self.state_file      = state_file
+        self.population      = population
+        self.thoughts        = thoughts
+        self.inbox           = ThoughtInbox(rate=input_rate)
+        self.pending_input   = PendingInput()
+        self.input_interval  = input_interval
+        self._next_input     = 0.0
+        self.checkpoints     = CheckpointWriter(state_file)
+        self.checkpoint_every = checkpoint_every
+        self.metrics         = MetricsSampler()
+        # Fixed byte budget for the neuron arrays, so other processes' memory no longer resizes
+        # the network. By default it is the genome's max_ram_usage share of MEMORY_POOL (small,
+        # for a shared machine), so mutating that gene really changes how large a Muminek grows;
+        # an explicit memory_budget replaces the share. max_ram_usage of total RAM caps both.
+        share                = int(max_ram_usage * MEMORY_POOL) if memory_budget is None else memory_budget
+        self.memory_budget   = min(share, int(max_ram_usage * self.metrics.total_ram))
+        self.autoscaler      = Autoscaler(self.memory_budget, min_neurons=neurons, max_neurons=max_neurons)
+        self._next_checkpoint = time.monotonic() + checkpoint_every if checkpoint_every else None
+
+        # Every random draw of the engine (initial world and weights, mutations, which peer
+        # messages are taken) comes from this Generator, so the same seed gives the same run
+        self.rng                  = np.random.default_rng(seed)
+        self.stream               = RandomStream(self.rng, dtype=dtype)
+        # A packed world stores 8 cells per byte, for grids far larger than the network reads
+        self.packed_world         = packed_world
+        self.world                = (BitWorld.random(grid_size, 0.1, rng=self.rng) if packed_world
+                                     else self.rng.random((grid_size, grid_size)) < 0.1)
+        self.neurons              = NeuronStore(self.rng.standard_normal((neurons, neurons)) * 0.01, dtype=dtype)
+        self._buffers             = None
+        self.emotions             = RingBuffer(EMOTION_WINDOW, levels=EMOTION_LEVELS)
+        self.cycle_counter        = 0
+        self.dreaming             = False
+        self.mutations_count      = 0
+        self.data_flow_mb         = 0
+        self.muminki_register     = []
+
+        # Observers (dashboard, benchmarks) take this lock to read a consistent state
+        self.lock     = threading.Lock()
+        self._stop    = threading.Event()
+        self._thread  = None
+
+    # Views into the neuron store, rebound after every grow/shrink
+    @property
+    def weights(self):
+        return self.neurons.weights
+
+    @property
+    def previous_activations(self):
+        return self.neurons.activations
+
+    def buffers(self):
+        if self._buffers is None or self._buffers.capacity != self.neurons.capacity:
+            self._buffers = StepBuffers(self.neurons.capacity, self.neurons.dtype)
+        return self._buffers
+
+    # ─── State ──────────────────────────────────────────────────────────────
+    def snapshot(self):
+        # Caller holds the lock; a memcpy here is all the simulation pays, disk I/O is on the writer thread
+        return {
+            "world": self.world.copy(),
+            "weights": self.weights.copy(),
+            "previous_activations": self.previous_activations.copy(),
+            "cycle_counter": self.cycle_counter
+        }
+
+    def save_state(self, wait=True):
+        with self.lock:
+            st = self.snapshot()
+        self.checkpoints.submit(st)
+        if wait:
+            self.checkpoints.flush()
+
+    def load_state(self):
+        if not os.path.exists(self.state_file):
+            print("Brak zapisu, start nowego świata.")
+            return False
+        self.checkpoints.flush()
+        # Read into memory rather than mapped: the store adopts these weights and later saves
+        # replace this same file, which Windows refuses while a mapping of it is open
+        st = load_checkpoint(self.state_file, mmap_mode=None)
+        with self.lock:
+            self.world[:]      = st["world"]
+            self.neurons.load(st["weights"], st["previous_activations"])
+            self.cycle_counter = st["cycle_counter"]
+        print("Stan wczytany.")
+        return True
+
+    # ─── Pipeline ───────────────────────────────────────────────────────────
+    def generate_signal(self):
+        buf  = self.buffers()
+        prev = self.previous_activations
+        n    = prev.size
+        flat = self.world.head(n) if self.packed_world else self.world.reshape(-1)[:n]
+        x    = buf.x[:n]
+        np.copyto(x, prev)
+        x[:flat.size] += flat
+        x *= 0.5
+        return forward(x, self.weights, out=buf.sig[:n])
+
+    def activate_neurons(self, sig):
+        buf  = self.buffers()
+        n    = sig.size
+        fire = np.greater(sig, fire_threshold(sig), out=buf.fire[:n])
+        act  = buf.act[:n]
+        np.copyto(act, fire)
+        return act
+
+    def reinforce_connections(self, act):
+        # hebbian_update counts nonzeros only where it writes, so the connection total stays
+        # exact without a separate N² scan
+        _, delta = hebbian_update(self.weights, act[:self.neurons.n], self.learning_rate,
+                                  scratch=self.buffers().scratch, count=True, bound=CLIP)
+        self.neurons.adjust(delta)
+
+    def control_world_by_output(self, act):
+        # Neuron i drives cell i (row-major), so the neuron→cell map is the first G² neurons
+        # and switching cells on is one OR over that prefix instead of a loop over indices
+        m    = min(act.size, self.grid_size*self.grid_size)
+        fire = np.greater(act[:m], 0.9, out=self.buffers().fire[:m])
+        if self.packed_world:
+            self.world.or_head(fire)
+        else:
+            flat = self.world.reshape(-1)[:m]
+            np.logical_or(flat, fire, out=flat)
+
+    def manage_neurons(self):
+        return self.autoscaler.step(self.neurons, self.cycle_counter)
+
+    def mutate_weights(self):
+        if self.mutation_k:
+            self.mutate_sparse(self.mutation_k)
+        else:
+            self.mutate_dense()
+        self.mutations_count += 1
+
+    def mutate_sparse(self, k):
+        # k connections drawn with replacement; cost follows k, and untouched zeros stay zero
+        w = self.weights
+        n = w.shape[0]
+        if n == 0 or k <= 0:
+            return
+        flat  = self.stream.integers(k, n*n)
+        noise = self.stream.normal(k) * self.mutation_rate
+        rows, cols = np.divmod(flat, n)
+        # Nonzero bookkeeping on the distinct cells; np.add.at sums repeated draws correctly
+        ur, uc = np.divmod(np.unique(flat), n)
+        before = np.count_nonzero(w[ur, uc])
+        np.add.at(w, (rows, cols), noise)
+        self.neurons.adjust(np.count_nonzero(w[ur, uc]) - before)
+
+    def mutate_dense(self):
+        # Noise is drawn a row block at a time into the scratch buffer, never as an N² matrix
+        w = self.weights
+        n = w.shape[0]
+        scratch = self.buffers().scratch
+        for r0, r1 in row_blocks(n, scratch.size):
+            noise = scratch[:(r1-r0)*n].reshape(r1-r0, n)
+            self.rng.standard_normal(out=noise, dtype=noise.dtype)
+            noise *= self.mutation_rate
+            w[r0:r1] += noise
+        self.neurons.recount()
+
+    # ─── Thoughts ───────────────────────────────────────────────────────────
+    def receive_thought(self, data, addr=None):
+        # Called from the network thread; only queues, the simulation applies it in life_cycle
+        self.inbox.put(data, addr)
+
+    def apply_thoughts(self):
+        for _, data in self.inbox.drain():
+            if self.rng.random() < INPUT_CHANCE:
+                self.mutate_from_input(data)
+        if not len(self.pending_input):
+            return 0
+        if self.input_interval:
+            now = time.monotonic()
+            if now < self._next_input:
+                return 0
+            self._next_input = now + self.input_interval
+        applied, delta = self.pending_input.apply(self.weights, self.mutation_rate, self.buffers().scratch)
+        self.neurons.adjust(delta)
+        return applied
+
+    def mutate_from_input(self, data):
+        # Peer bytes become noise in [-0.5, 0.5) scaled by mutation_rate, as in the muminek variants;
+        # the bytes are repeated to cover the whole matrix so any network size is affected.
+        # Only accumulated here, apply_thoughts() adds everything to weights in one pass.
+        self.pending_input.add(data, self.weights.size)
+
+    def create_muminek(self):
+        # With a population attached, a new muminek is an offspring record evaluated in its pool
+        if self.population is None:
+            self.muminki_register.append(str(uuid.uuid4()))
+            return
+        child = self.population.reproduce()
+        if child is not None:
+            self.muminki_register.append(child.id)
+
+    def life_cycle(self):
+        with self.lock:
+            sig = self.generate_signal()
+            act = self.activate_neurons(sig)
+            self.reinforce_connections(act)
+            self.control_world_by_output(act)
+            self.emotions.append(act.mean())
+            self.data_flow_mb += act.nbytes/(1024*1024)
+            # Stored before resizing: pruning moves activations together with their neurons
+            np.copyto(self.previous_activations, act)
+            self.manage_neurons()
+            if self.cycle_counter%MUMINEK_CYCLE == 0: self.create_muminek()
+            if self.cycle_counter%MUTATION_CYCLE == 0: self.mutate_weights()
+            if self.maintenance is not None and self.maintenance.due(self.cycle_counter):
+                self.last_maintenance = self.maintenance.run(self.neurons)
+            if len(self.inbox) or len(self.pending_input): self.apply_thoughts()
+            self.cycle_counter += 1
+            if self.dreaming or (self._next_checkpoint is not None
+                                 and time.monotonic() >= self._next_checkpoint):
+                self.checkpoints.submit(self.snapshot())
+                self.dreaming = False
+                if self.checkpoint_every:
+                    self._next_checkpoint = time.monotonic() + self.checkpoint_every
+        if self.thoughts is not None:
+            self.thoughts.broadcast(act)
+
+    # ─── Running ────────────────────────────────────────────────────────────
+    def run(self, cycles=None, seconds=None):
+        self._stop.clear()
+        deadline = time.perf_counter() + seconds if seconds else None
+        done = 0
+        while not self._stop.is_set():
+            if cycles is not None and done >= cycles:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            self.life_cycle()
+            done += 1
+        return done
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return self._thread
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def stats(self):
+        with self.lock:
+            return {
+                "neurons": self.weights.shape[0],
+                "cycle": self.cycle_counter,
+                "mutations": self.mutations_count,
+                "connections": self.neurons.nonzero,
+                "density": self.neurons.nonzero / max(self.neurons.n, 1)**2,
+                "live": self.world.count() if self.packed_world else int(np.count_nonzero(self.world)),
+                "muminki": len(self.muminki_register),
+                "data_mb": self.data_flow_mb,
+                "joy": self.emotions.mean(10),
+                "ram": self.metrics.ram_percent(),
+                "memory_mb": self.neurons.nbytes/(1024*1024),
+            }
+
+
+# ─── Headless entry point ───────────────────────────────────────────────────
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Muminki bez okna – symulacja tak szybko jak CPU pozwoli")
+    ap.add_argument("--cycles",   type=int,   default=None, help="liczba cykli (domyślnie bez końca)")
+    ap.add_argument("--seconds",  type=float, default=None, help="czas działania w sekundach")
+    ap.add_argument("--grid",     type=int,   default=GRID_SIZE)
+    ap.add_argument("--neurons",  type=int,   default=INITIAL_NEURONS)
+    ap.add_argument("--max-neurons", type=int, default=None, help="górny limit liczby neuronów")
+    ap.add_argument("--report",   type=float, default=1.0, help="co ile sekund wypisać statystyki")
+    ap.add_argument("--genome",   default=None, help="plik genomu (JSON) z parametrami Muminka")
+    ap.add_argument("--load",     action="store_true", help="wczytaj zapisany stan")
+    ap.add_argument("--save",     action="store_true", help="zapisz stan na końcu")
+    ap.add_argument("--port",     type=int,   default=None, help="port na myśli od innych Muminków (domyślnie z genomu)")
+    ap.add_argument("--peers",    default=None, help="host:port,host:port – do kogo wysyłać myśli")
+    ap.add_argument("--input-rate", type=float, default=None, help="limit ramek na sekundę od jednego Muminka")
+    ap.add_argument("--input-interval", type=float, default=None, help="co ile sekund dodać zebrane mutacje do wag")
+    ap.add_argument("--dtype",    choices=("float64", "float32"), default="float64",
+                    help="typ wag i aktywacji (float32 = połowa pamięci)")
+    ap.add_argument("--packed-world", action="store_true", help="świat upakowany bitowo (duże siatki)")
+    ap.add_argument("--mutation-k", type=int, default=None, help="mutuj tylko k losowych połączeń")
+    ap.add_argument("--seed",     type=int,   default=None, help="ziarno generatora (świat, wagi, mutacje)")
+    ap.add_argument("--maintain",  type=int,  default=None, help="co ile cykli zanik/przycięcie/usuwanie wag")
+    ap.add_argument("--decay",     type=float, default=DECAY, help="mnożnik wag przy każdej pielęgnacji")
+    ap.add_argument("--clip",      type=float, default=CLIP, help="maksymalna |waga|")
+    ap.add_argument("--prune",     type=float, default=PRUNE_BELOW, help="wagi o |w| poniżej są zerowane")
+    ap.add_argument("--memory-budget", type=float, default=None,
+                    help=f"budżet pamięci na wagi w MB (domyślnie max_ram_usage × {MEMORY_POOL >> 20} MB)")
+    ap.add_argument("--checkpoint", type=float, default=None, help="co ile sekund zapisywać stan w tle")
+    args = ap.parse_args(argv)
+
+    if args.genome:
+        from genome import Genome
+        genome = Genome.load(args.genome)
+        kwargs = genome.engine_kwargs()
+        if args.port is None:
+            # The genome assigns each muminek its own port; --port still overrides it
+            args.port = genome.port
+    else:
+        kwargs = {"grid_size": args.grid, "neurons": args.neurons}
+    maintenance = (Maintenance(args.maintain, args.decay, args.clip, args.prune)
+                   if args.maintain else None)
+    eng = Engine(max_neurons=args.max_neurons, maintenance=maintenance, checkpoint_every=args.checkpoint,
+                 input_rate=args.input_rate, input_interval=args.input_interval,
+                 memory_budget=int(args.memory_budget*1024*1024) if args.memory_budget else None,
+                 dtype=args.dtype, packed_world=args.packed_world,
+                 mutation_k=args.mutation_k, seed=args.seed, **kwargs)
+    if args.load:
+        eng.load_state()
+    server = None
+    if args.port is not None:
+        server = ThoughtServer(eng.receive_thought, port=args.port).start()
+    if args.peers is not None or os.environ.get(PEERS_ENV):
+        # Peers tell this Muminek's frames apart by the port it listens on
+        eng.thoughts = ThoughtSender(parse_peers(args.peers), port=server.port if server else 0)
+
+    t0 = time.perf_counter()
+    total = 0
+    try:
+        while True:
+            left = None if args.cycles is None else args.cycles - total
+            if left is not None and left <= 0:
+                break
+            elapsed = time.perf_counter() - t0
+            if args.seconds is not None and elapsed >= args.seconds:
+                break
+            chunk = args.report
+            if args.seconds is not None:
+                chunk = min(chunk, args.seconds - elapsed)
+            total += eng.run(cycles=left, seconds=chunk)
+            st = eng.stats()
+            print(f"Cykl: {st['cycle']}  Neurony: {st['neurons']}  "
+                  f"Cykle/s: {total/(time.perf_counter()-t0):.0f}")
+            if eng.last_maintenance is not None:
+                m = eng.last_maintenance
+                print(f"  Gęstość: {m['density']:.3f}  Usunięte: {maintenance.pruned}  "
+                      f"Zwolnione: {maintenance.freed/(1024*1024):.2f} MB (CSR)")
+    except KeyboardInterrupt:
+        pass
+
+    if args.save:
+        eng.save_state()
+    return eng
+
+
+if __name__ == "__main__":
+    main()
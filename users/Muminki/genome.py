@@ -0,0 +1,92 @@
+# genome.py
+# Genom Muminka – parametry potomstwa jako dane, bez przepisywania kodu źródłowego
+
+import json
+import random
+import uuid
+from dataclasses import dataclass, field, asdict, replace
+
+from engine import GRID_SIZE, INITIAL_NEURONS, LEARNING_RATE, MUTATION_RATE, MAX_RAM_USAGE
+
+# ─── Constants ──────────────────────────────────────────────────────────────
+GENOME_VERSION   = 1
+PORT_BASE        = 5007
+PORT_MIN         = 1024
+PORT_MAX         = 65535
+# (chance, low, high, digits) – the same draws mutate_code() did on the source text
+MUTATIONS = {
+    "learning_rate": (0.5, 0.001, 0.05, 5),
+    "mutation_rate": (0.5, 0.01,  0.2,  5),
+    "max_ram_usage": (0.3, 0.2,   0.8,  2),
+}
+
+
+def next_port(port):
+    # The port after `port`, wrapping back to PORT_MIN past the top of the range
+    return port + 1 if port < PORT_MAX else PORT_MIN
+
+
+@dataclass
+class Genome:
+    learning_rate: float = LEARNING_RATE
+    mutation_rate: float = MUTATION_RATE
+    max_ram_usage: float = MAX_RAM_USAGE
+    port:          int   = PORT_BASE
+    grid_size:     int   = GRID_SIZE
+    neurons:       int   = INITIAL_NEURONS
+    generation:    int   = 0
+    parent:        str   = None
+    id:            str   = field(default_factory=lambda: str(uuid.uuid4()))
+
+    def __post_init__(self):
+        # Clamp instead of failing so every genome on disk stays runnable
+        for name, (_, lo, hi, _) in MUTATIONS.items():
+            setattr(self, name, min(hi, max(lo, float(getattr(self, name)))))
+        # A port is an address, not a tunable: clamping could silently collide with a sibling
+        self.port      = int(self.port)
+        if not PORT_MIN <= self.port <= PORT_MAX:
+            raise ValueError(f"Port poza zakresem {PORT_MIN}–{PORT_MAX}: {self.port}")
+        self.grid_size = max(1, int(self.grid_size))
+        self.neurons   = max(1, int(self.neurons))
+
+    def mutate(self, port=None, rng=random):
+        changes = {}
+        for name, (chance, lo, hi, digits) in MUTATIONS.items():
+            if rng.random() < chance:
+                changes[name] = round(rng.uniform(lo, hi), digits)
+        return replace(self, **changes,
+                       port=next_port(self.port) if port is None else port,
+                       generation=self.generation + 1,
+                       parent=self.id,
+                       id=str(uuid.uuid4()))
+
+    def engine_kwargs(self):
+        return {
+            "grid_size": self.grid_size,
+            "neurons": self.neurons,
+            "learning_rate": self.learning_rate,
+            "mutation_rate": self.mutation_rate,
+            "max_ram_usage": self.max_ram_usage,
+        }
+
+    # ─── Serialization ──────────────────────────────────────────────────────
+    def to_dict(self):
+        return {"version": GENOME_VERSION, **asdict(self)}
+
+    @classmethod
+    def from_dict(cls, d):
+        d = dict(d)
+        version = d.pop("version", GENOME_VERSION)
+        if version > GENOME_VERSION:
+            raise ValueError(f"Nieznana wersja genomu: {version}")
+        known = cls.__dataclass_fields__
+        return cls(**{k: v for k, v in d.items() if k in known})
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
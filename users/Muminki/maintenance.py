@@ -0,0 +1,68 @@
+# maintenance.py
+# Pielęgnacja wag – zanik, przycinanie wartości i usuwanie słabych połączeń co kilka cykli
+
+import numpy as np
+
+# ─── Constants ──────────────────────────────────────────────────────────────
+MAINTENANCE_CYCLE = 100
+DECAY             = 0.99
+CLIP              = 4.0
+PRUNE_BELOW       = 0.005
+MAINTENANCE_BLOCK = 1 << 16
+INDEX_BYTES       = 4
+
+
+def sparse_bytes(nonzero, n, itemsize):
+    # Size of the same weights as CSR: values + column indices + row pointers
+    return nonzero*(itemsize + INDEX_BYTES) + (n + 1)*INDEX_BYTES
+
+
+class Maintenance:
+    # Every `every` cycles: weights *= decay, clip to ±clip, zero |w| < prune_below.
+    # One pass over the matrix in row blocks, so temporaries stay MAINTENANCE_BLOCK-sized.
+    def __init__(self, every=MAINTENANCE_CYCLE, decay=DECAY, clip=CLIP, prune_below=PRUNE_BELOW,
+                 block=MAINTENANCE_BLOCK):
+        self.every       = every
+        self.decay       = decay
+        self.clip        = clip
+        self.prune_below = prune_below
+        self.block       = block
+        self.passes      = 0
+        self.pruned      = 0
+        self.freed       = 0
+
+    def due(self, cycle):
+        return self.every and cycle % self.every == 0
+
+    def run(self, store):
+        w = store.weights
+        n = w.shape[0]
+        before  = store.nonzero
+        clipped = nonzero = 0
+        rows = max(1, self.block // max(n, 1))
+        for r0 in range(0, n, rows):
+            blk = w[r0:r0+rows]
+            if self.decay is not None and self.decay != 1:
+                blk *= self.decay
+            if self.clip is not None:
+                clipped += int(np.count_nonzero(np.abs(blk) > self.clip))
+                np.clip(blk, -self.clip, self.clip, out=blk)
+            if self.prune_below:
+                blk[np.abs(blk) < self.prune_below] = 0
+            nonzero += int(np.count_nonzero(blk))
+        store.nonzero = nonzero
+        pruned = max(0, before - nonzero)
+        # The dense buffer keeps its size; freed bytes are what a sparse copy (CSR) would save
+        freed  = pruned * (store.dtype.itemsize + INDEX_BYTES)
+        self.passes += 1
+        self.pruned += pruned
+        self.freed  += freed
+        return {
+            "nonzero": nonzero,
+            "density": nonzero / (n*n) if n else 0.0,
+            "pruned": pruned,
+            "clipped": clipped,
+            "bytes_freed": freed,
+            "sparse_bytes": sparse_bytes(nonzero, n, store.dtype.itemsize),
+            "dense_bytes": n*n*store.dtype.itemsize,
+        }
@@ -0,0 +1,39 @@
+# metrics.py
+# Próbkowanie metryk systemu we własnym rytmie – pętla symulacji czyta tylko zapamiętane wartości
+
+import time
+
+import psutil
+
+# ─── Constants ──────────────────────────────────────────────────────────────
+SAMPLE_INTERVAL  = 0.5
+
+
+class MetricsSampler:
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval  = interval
+        self.samples   = 0
+        self._next     = 0.0
+        self._ram      = 0.0
+        self._rss      = 0
+        self._process  = psutil.Process()
+        self.total_ram = psutil.virtual_memory().total
+
+    def sample(self, force=False):
+        now = time.monotonic()
+        if force or now >= self._next:
+            self._ram  = psutil.virtual_memory().percent / 100
+            self._rss  = self._process.memory_info().rss
+            self._next = now + self.interval
+            self.samples += 1
+
+    def ram_fraction(self):
+        self.sample()
+        return self._ram
+
+    def ram_percent(self):
+        return self.ram_fraction() * 100
+
+    def rss(self):
+        self.sample()
+        return self._rss
@@ -0,0 +1,163 @@
+# population.py
+# Populacja Muminków – potomstwo jako genomy liczone w ograniczonej puli procesów
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from engine import Engine
+from genome import PORT_MAX, PORT_MIN, Genome
+
+# ─── Constants ──────────────────────────────────────────────────────────────
+MAX_POPULATION   = 64
+EVAL_CYCLES      = 2000
+PORT_SPAN        = 1024
+
+
+# ─── Offspring ──────────────────────────────────────────────────────────────
+def evaluate(genome, cycles=EVAL_CYCLES, max_neurons=None):
+    # No default cap: the network size comes from the genome's max_ram_usage share of the pool
+    eng = Engine(max_neurons=max_neurons, **genome.engine_kwargs())
+    eng.run(cycles=cycles)
+    st = eng.stats()
+    st["fitness"] = eng.emotions.lifetime_mean()
+    return genome.id, st
+
+
+# ─── Population ─────────────────────────────────────────────────────────────
+class Population:
+    def __init__(self, founder=None, max_workers=None, max_population=MAX_POPULATION,
+                 cycles=EVAL_CYCLES, port_span=PORT_SPAN, **eval_kwargs):
+        self.max_workers    = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self.max_population = max_population
+        self.cycles         = cycles
+        self.eval_kwargs    = eval_kwargs
+        self.members        = {}
+        self.fitness        = {}
+        self.pending        = {}
+        self.born           = 0
+        self.reaped         = 0
+        self.pool           = ProcessPoolExecutor(max_workers=self.max_workers)
+        founder = founder or Genome()
+        self.members[founder.id] = founder
+        # Offspring ports come from a fixed window starting at the founder's port (moved down
+        # if the founder sits near the top), so they never run past PORT_MAX
+        low = max(PORT_MIN, min(founder.port, PORT_MAX - port_span + 1))
+        self.ports = range(low, min(PORT_MAX, low + port_span - 1) + 1)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        for fut in self.pending.values():
+            fut.cancel()
+        self.pool.shutdown(wait=True, cancel_futures=True)
+        self.pending.clear()
+
+    def pick_parent(self):
+        scored = [m for m in self.members.values() if m.id in self.fitness]
+        if not scored:
+            return random.choice(list(self.members.values()))
+        # Tournament of two keeps some diversity instead of always cloning the best
+        a, b = random.choice(scored), random.choice(scored)
+        return a if self.fitness[a.id] >= self.fitness[b.id] else b
+
+    def reproduce(self, parent=None):
+        # Never queue more work than the pool can run; the caller simply skips this cycle
+        self.poll()
+        if len(self.pending) >= self.max_workers:
+            return None
+        port = self.next_port()
+        if port is None:
+            return None
+        child = (parent or self.pick_parent()).mutate(port=port)
+        self.members[child.id] = child
+        self.pending[child.id] = self.pool.submit(evaluate, child, self.cycles, **self.eval_kwargs)
+        self.born += 1
+        self.reap()
+        return child
+
+    def poll(self):
+        done = [cid for cid, fut in self.pending.items() if fut.done()]
+        for cid in done:
+            fut = self.pending.pop(cid)
+            if fut.cancelled() or fut.exception() is not None:
+                self.members.pop(cid, None)
+                continue
+            _, st = fut.result()
+            if cid in self.members:
+                self.fitness[cid] = st["fitness"]
+        return len(done)
+
+    def reap(self):
+        # Drop the weakest evaluated members; ones still being evaluated are kept
+        over = len(self.members) - self.max_population
+        if over <= 0:
+            return 0
+        scored = sorted((m for m in self.members.values() if m.id in self.fitness),
+                        key=lambda m: self.fitness[m.id])
+        for m in scored[:over]:
+            del self.members[m.id]
+            del self.fitness[m.id]
+        self.reaped += min(over, len(scored))
+        return min(over, len(scored))
+
+    def wait(self):
+        for fut in list(self.pending.values()):
+            try:
+                fut.result()
+            except Exception:
+                pass
+        self.poll()
+
+    def best(self, k=1):
+        scored = [m for m in self.members.values() if m.id in self.fitness]
+        return sorted(scored, key=lambda m: self.fitness[m.id], reverse=True)[:k]
+
+    def next_port(self):
+        # Lowest port in the window no living member holds; reaped members' ports come back.
+        # None when the window is full, and reproduce() skips the cycle.
+        taken = {m.port for m in self.members.values()}
+        return next((p for p in self.ports if p not in taken), None)
+
+    def save(self, folder):
+        os.makedirs(folder, exist_ok=True)
+        for m in self.members.values():
+            m.save(os.path.join(folder, f"{m.id}.json"))
+
+    def __len__(self):
+        return len(self.members)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Populacja Muminków w puli procesów")
+    ap.add_argument("--seconds",        type=float, default=30)
+    ap.add_argument("--workers",        type=int,   default=None)
+    ap.add_argument("--max-population", type=int,   default=MAX_POPULATION)
+    ap.add_argument("--cycles",         type=int,   default=EVAL_CYCLES)
+    ap.add_argument("--save",           default=None, help="folder na genomy populacji")
+    args = ap.parse_args(argv)
+
+    with Population(max_workers=args.workers, max_population=args.max_population,
+                    cycles=args.cycles) as pop:
+        deadline = time.perf_counter() + args.seconds
+        while time.perf_counter() < deadline:
+            if pop.reproduce() is None:
+                time.sleep(0.01)
+        pop.wait()
+        if args.save:
+            pop.save(args.save)
+        print(f"Urodzone: {pop.born}  Usunięte: {pop.reaped}  Populacja: {len(pop)}")
+        for m in pop.best(5):
+            print(f"  gen={m.generation}  lr={m.learning_rate}  mr={m.mutation_rate}  "
+                  f"ram={m.max_ram_usage}  port={m.port}  radość={pop.fitness[m.id]:.3f}")
+    return pop
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# randstream.py
+# Strumień liczb losowych – generowane hurtem z jednego Generatora, wydawane po kawałku
+
+import numpy as np
+
+# ─── Constants ──────────────────────────────────────────────────────────────
+STREAM_BLOCK     = 1 << 16
+
+
+class RandomStream:
+    # Draws normals and uniforms from the Generator in blocks of `block` values and hands out
+    # slices, so many small requests cost one bulk draw. Same seed, same sequence of requests
+    # → same values. Returned arrays are views, valid until the next call.
+    def __init__(self, rng, dtype=float, block=STREAM_BLOCK):
+        self.rng      = rng
+        self.dtype    = np.dtype(dtype)
+        self.block    = block
+        self._normal  = np.empty(0, dtype=self.dtype)
+        self._uniform = np.empty(0)
+        self._ni = self._ui = 0
+
+    def _take(self, k, kind):
+        buf, i = (self._normal, self._ni) if kind == "normal" else (self._uniform, self._ui)
+        if i + k > buf.size:
+            size = max(self.block, k)
+            if buf.size < size:
+                buf = np.empty(size, dtype=buf.dtype)
+            buf = buf[:size]
+            if kind == "normal":
+                self.rng.standard_normal(out=buf, dtype=buf.dtype)
+            else:
+                self.rng.random(out=buf)
+            i = 0
+        if kind == "normal":
+            self._normal, self._ni = buf, i + k
+        else:
+            self._uniform, self._ui = buf, i + k
+        return buf[i:i+k]
+
+    def normal(self, k):
+        return self._take(k, "normal")
+
+    def integers(self, k, high):
+        # Uniform in [0, high); floats scaled and floored, so `high` can change between calls
+        u = self._take(k, "uniform")
+        return (u * high).astype(np.intp)
@@ -0,0 +1,67 @@
+# renderer.py
+# Rysowanie świata Muminków – jeden PhotoImage zamiast GRID_SIZE² prostokątów
+
+import numpy as np
+import tkinter as tk
+
+# ─── Constants ──────────────────────────────────────────────────────────────
+LIVE_MIN      = 100
+LIVE_MAX      = 255
+BRIGHT_BOOST  = 50
+# Above this fraction of changed cells one full PPM upload is cheaper than per-cell puts;
+# every put is a Tcl call, so large grids are also capped at MAX_CELL_PUTS per frame
+FULL_REDRAW   = 1/16
+MAX_CELL_PUTS = 256
+
+
+def frame_rgb(world, colors, bright=False):
+    rgb = np.where(world[..., None], colors, 0).astype(np.uint8)
+    if bright:
+        np.minimum(rgb.astype(np.uint16) + BRIGHT_BOOST, 255, out=rgb, casting="unsafe")
+    return rgb
+
+def to_ppm(rgb, cell_size):
+    if cell_size > 1:
+        rgb = rgb.repeat(cell_size, axis=0).repeat(cell_size, axis=1)
+    h, w = rgb.shape[:2]
+    return f"P6\n{w} {h}\n255\n".encode() + rgb.tobytes()
+
+
+class WorldRenderer:
+    def __init__(self, canvas, grid_size, cell_size, seed=None):
+        self.canvas    = canvas
+        self.grid_size = grid_size
+        self.cell_size = cell_size
+        self.rng       = np.random.default_rng(seed)
+        # Each live cell keeps its colour until it dies, so unchanged cells need no redraw
+        self.colors    = self.rng.integers(LIVE_MIN, LIVE_MAX+1, (grid_size, grid_size, 3), dtype=np.uint8)
+        self.shown     = None
+        self.bright    = False
+        self.image     = tk.PhotoImage(width=grid_size*cell_size, height=grid_size*cell_size)
+        self.item      = canvas.create_image(0, 0, image=self.image, anchor="nw")
+
+    def draw(self, world, bright=False):
+        if self.shown is None or bright != self.bright:
+            born = world
+            changed = None
+        else:
+            diff = world != self.shown
+            born = diff & world
+            changed = np.flatnonzero(diff)
+
+        k = int(np.count_nonzero(born))
+        if k:
+            self.colors[born] = self.rng.integers(LIVE_MIN, LIVE_MAX+1, (k, 3), dtype=np.uint8)
+
+        if changed is None or changed.size > min(FULL_REDRAW * world.size, MAX_CELL_PUTS):
+            self.image.configure(data=to_ppm(frame_rgb(world, self.colors, bright), self.cell_size), format="PPM")
+        elif changed.size:
+            live = world.reshape(-1)[changed]
+            rgb  = frame_rgb(live, self.colors.reshape(-1, 3)[changed], bright)
+            cs, g = self.cell_size, self.grid_size
+            for idx, (r, gr, b) in zip(changed.tolist(), rgb.tolist()):
+                y, x = divmod(idx, g)
+                self.image.put(f"#{r:02x}{gr:02x}{b:02x}", to=(x*cs, y*cs, (x+1)*cs, (y+1)*cs))
+
+        self.shown  = world.copy()
+        self.bright = bright
@@ -0,0 +1,75 @@
+# ringbuffer.py
+# Bufory cykliczne na emocje i zapis aktywacji – stała pamięć niezależnie od czasu działania
+
+import numpy as np
+
+# ─── Constants ──────────────────────────────────────────────────────────────
+DOWNSAMPLE_FACTOR = 10
+
+
+class RingBuffer:
+    def __init__(self, capacity, dtype=float, levels=0, factor=DOWNSAMPLE_FACTOR):
+        self.capacity    = capacity
+        self._data       = np.zeros(capacity, dtype=dtype)
+        self._head       = 0
+        self._size       = 0
+        self.total_count = 0
+        self.total_sum   = 0.0
+        # Long-term history: each level keeps means of `factor` samples of the level below
+        self.factor      = factor
+        self.history     = RingBuffer(capacity, dtype, levels-1, factor) if levels > 0 else None
+        self._acc        = 0.0
+        self._acc_n      = 0
+
+    def append(self, value):
+        self._data[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+        self.total_count += 1
+        self.total_sum   += value
+        if self.history is not None:
+            self._acc   += value
+            self._acc_n += 1
+            if self._acc_n == self.factor:
+                self.history.append(self._acc / self.factor)
+                self._acc, self._acc_n = 0.0, 0
+
+    def last(self, k=None):
+        # Oldest to newest, like list[-k:]
+        k = self._size if k is None else min(k, self._size)
+        if k == 0:
+            return self._data[:0].copy()
+        idx = (self._head - k + np.arange(k)) % self.capacity
+        return self._data[idx]
+
+    def values(self):
+        return self.last()
+
+    def mean(self, k=None):
+        if self._size == 0:
+            return 0.0
+        if k is None or k >= self._size:
+            return float(self._data[:self._size].mean())
+        return float(self.last(k).mean())
+
+    def percentile(self, q, k=None):
+        if self._size == 0:
+            return 0.0
+        return float(np.percentile(self.last(k), q))
+
+    def lifetime_mean(self):
+        return self.total_sum / self.total_count if self.total_count else 0.0
+
+    @property
+    def nbytes(self):
+        return self._data.nbytes + (self.history.nbytes if self.history is not None else 0)
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    def __getitem__(self, key):
+        return self.values()[key]
@@ -0,0 +1,93 @@
+# snapshot.py
+# Zapis stanu Muminków – zwarty format binarny, wagi wczytywane przez mmap bez unpicklingu
+#
+# Layout: MAGIC | uint32 version | uint32 header length | JSON header | arrays
+# Every array starts on an ALIGN boundary so it can be memory-mapped in place.
+
+import json
+import os
+import struct
+
+import numpy as np
+
+# ─── Constants ──────────────────────────────────────────────────────────────
+MAGIC            = b"MUMINKI\0"
+SNAPSHOT_VERSION = 1
+ALIGN            = 64
+PREFIX           = struct.Struct("<8sII")
+
+
+def pack_world(world):
+    # A bit-packed world (bitworld.BitWorld) already has this layout
+    bits = getattr(world, "bits", None)
+    if bits is not None:
+        return bits
+    return np.packbits(np.asarray(world, dtype=bool), axis=-1)
+
+def unpack_world(packed, shape):
+    return np.unpackbits(packed, axis=-1, count=shape[-1]).reshape(shape).astype(bool)
+
+
+def save_snapshot(path, world, weights, previous_activations, cycle_counter, **meta):
+    arrays = {
+        "world": pack_world(world),
+        "weights": np.ascontiguousarray(weights),
+        "previous_activations": np.ascontiguousarray(previous_activations),
+    }
+    header = {
+        "cycle_counter": int(cycle_counter),
+        "world_shape": list(np.shape(world)),
+        "meta": meta,
+        "arrays": {},
+    }
+    # Offsets depend on the header size, so lay out twice until the header stops growing
+    hlen = 0
+    while True:
+        offset = PREFIX.size + hlen
+        for name, arr in arrays.items():
+            offset = -(-offset // ALIGN) * ALIGN
+            header["arrays"][name] = {"dtype": arr.dtype.str, "shape": list(arr.shape), "offset": offset}
+            offset += arr.nbytes
+        raw = json.dumps(header).encode("utf-8")
+        if len(raw) <= hlen:
+            break
+        hlen = -(-len(raw) // ALIGN) * ALIGN
+    raw = raw.ljust(hlen, b" ")
+
+    # Write next to the target and rename, so readers never see a half-written file. On POSIX a
+    # live memmap of the old file keeps its inode; on Windows the rename fails while any mapping
+    # of `path` is open, so callers that save back to a file must not keep it mapped.
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(PREFIX.pack(MAGIC, SNAPSHOT_VERSION, hlen))
+        f.write(raw)
+        for name, arr in arrays.items():
+            f.seek(header["arrays"][name]["offset"])
+            f.write(arr.tobytes())
+    os.replace(tmp, path)
+    return path
+
+def read_header(path):
+    with open(path, "rb") as f:
+        magic, version, hlen = PREFIX.unpack(f.read(PREFIX.size))
+        if magic != MAGIC:
+            raise ValueError(f"To nie jest zapis Muminków: {path}")
+        if version > SNAPSHOT_VERSION:
+            raise ValueError(f"Nieznana wersja zapisu: {version}")
+        return json.loads(f.read(hlen))
+
+def load_snapshot(path, mmap_mode="c"):
+    # mmap_mode="c" maps weights copy-on-write: loading is O(1) and pages are read on first touch
+    header = read_header(path)
+    out = {"cycle_counter": header["cycle_counter"], "meta": header.get("meta", {})}
+    for name, spec in header["arrays"].items():
+        dtype, shape = np.dtype(spec["dtype"]), tuple(spec["shape"])
+        if mmap_mode and int(np.prod(shape)):
+            arr = np.memmap(path, dtype=dtype, mode=mmap_mode, offset=spec["offset"], shape=shape)
+        else:
+            with open(path, "rb") as f:
+                f.seek(spec["offset"])
+                arr = np.fromfile(f, dtype=dtype, count=int(np.prod(shape))).reshape(shape)
+        out[name] = arr
+    out["world"] = unpack_world(out["world"], tuple(header["world_shape"]))
+    return out
@@ -0,0 +1,114 @@
+# store.py
+# Magazyn neuronów – wagi w buforze z zapasem, rośnie geometrycznie zamiast np.pad co cykl
+
+import numpy as np
+
+# ─── Constants ──────────────────────────────────────────────────────────────
+NEW_WEIGHT     = 0.01
+GROWTH_FACTOR  = 2
+
+
+class NeuronStore:
+    def __init__(self, weights, activations=None, capacity=None, dtype=float):
+        self.dtype = np.dtype(dtype)
+        self.load(weights, activations, capacity)
+
+    # ─── Views ──────────────────────────────────────────────────────────────
+    # Active N×N block; valid until the next grow() that reallocates
+    @property
+    def weights(self):
+        return self._weights[:self.n, :self.n]
+
+    @property
+    def activations(self):
+        return self._activations[:self.n]
+
+    @property
+    def capacity(self):
+        return self._weights.shape[0]
+
+    @property
+    def nbytes(self):
+        return self._weights.nbytes + self._activations.nbytes
+
+    # ─── Connection count ───────────────────────────────────────────────────
+    # Kept up to date by the resizing methods so stats never scan N² weights;
+    # callers that rewrite weights wholesale call recount(), local edits use adjust()
+    def recount(self):
+        self.nonzero = int(np.count_nonzero(self.weights))
+        return self.nonzero
+
+    def adjust(self, delta):
+        self.nonzero += int(delta)
+
+    # ─── Resizing ───────────────────────────────────────────────────────────
+    def load(self, weights, activations=None, capacity=None):
+        n = weights.shape[0]
+        cap = max(n, capacity or 0)
+        self._activations = np.zeros(cap, dtype=self.dtype)
+        if cap == n and weights.dtype == self.dtype and weights.flags.c_contiguous and weights.flags.writeable:
+            # Adopt the array (e.g. a copy-on-write memmap) instead of copying N² values
+            self._weights = weights
+        else:
+            self._weights = np.zeros((cap, cap), dtype=self.dtype)
+            self._weights[:n, :n] = weights
+        if activations is not None:
+            m = min(n, activations.size)
+            self._activations[:m] = activations[:m]
+        self.n = n
+        self.recount()
+
+    def reserve(self, capacity):
+        if capacity <= self.capacity:
+            return
+        n = self.n
+        w = np.zeros((capacity, capacity), dtype=self.dtype)
+        a = np.zeros(capacity, dtype=self.dtype)
+        w[:n, :n] = self._weights[:n, :n]
+        a[:n]     = self._activations[:n]
+        self._weights, self._activations = w, a
+
+    def grow(self, k=1, fill=NEW_WEIGHT, max_capacity=None):
+        n, m = self.n, self.n + k
+        if m > self.capacity:
+            cap = max(m, self.capacity*GROWTH_FACTOR, 1)
+            if max_capacity is not None:
+                # Don't double past a memory budget, but always fit the requested neurons
+                cap = max(m, min(cap, max_capacity))
+            self.reserve(cap)
+        self._weights[n:m, :m] = fill
+        self._weights[:n, n:m] = fill
+        self._activations[n:m] = 0
+        self.n = m
+        if fill != 0:
+            self.nonzero += k*m + n*k
+
+    def shrink(self, k=1):
+        n = self.n
+        m = max(0, n - k)
+        w = self._weights
+        self.nonzero -= int(np.count_nonzero(w[m:n, :n]) + np.count_nonzero(w[:m, m:n]))
+        self.n = m
+
+    def remove(self, idx):
+        # Move the last neuron into the freed slot, O(N) instead of O(N²)
+        idx = np.unique(np.asarray(idx, dtype=np.intp))[::-1]
+        for i in idx:
+            last = self.n - 1
+            w = self._weights
+            self.nonzero -= int(np.count_nonzero(w[i, :self.n]) + np.count_nonzero(w[:self.n, i])
+                                - (w[i, i] != 0))
+            if i != last:
+                self._weights[i, :self.n] = self._weights[last, :self.n]
+                self._weights[:self.n, i] = self._weights[:self.n, last]
+                self._activations[i]      = self._activations[last]
+            self.n = last
+
+    def compact(self, max_capacity=None):
+        # Give memory back once the network has shrunk well below capacity,
+        # or as soon as the buffer is larger than max_capacity allows
+        cap = 2*self.n if self.capacity > 4*max(self.n, 1) else self.capacity
+        if max_capacity is not None:
+            cap = max(self.n, min(cap, max_capacity))
+        if cap < self.capacity:
+            self.load(self.weights.copy(), self.activations.copy(), capacity=cap)
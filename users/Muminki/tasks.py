@@ -0,0 +1,62 @@
+# tasks.py
+# Zadania w tle dla dashboardu – praca na wątkach, wyniki wracają do Tk przez kolejkę
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# ─── Constants ──────────────────────────────────────────────────────────────
+TASK_WORKERS     = 4
+POLL_BUDGET      = 50
+
+
+class TaskRunner:
+    # Workers never touch Tk; everything they want shown goes through post(),
+    # and the Tk thread runs it from poll()
+    def __init__(self, max_workers=TASK_WORKERS):
+        self.pool     = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="muminki")
+        self._results = queue.Queue()
+        self._running = set()
+        self._lock    = threading.Lock()
+
+    def post(self, fn, *args):
+        self._results.put((fn, args))
+
+    def submit(self, fn, *args, on_done=None, on_error=None, key=None):
+        # With a key, a job that is still running is not started twice (e.g. button spam)
+        if key is not None:
+            with self._lock:
+                if key in self._running:
+                    return None
+                self._running.add(key)
+        fut = self.pool.submit(fn, *args)
+        fut.add_done_callback(lambda f: self._finished(f, on_done, on_error, key))
+        return fut
+
+    def _finished(self, fut, on_done, on_error, key):
+        if key is not None:
+            with self._lock:
+                self._running.discard(key)
+        err = fut.exception()
+        if err is not None:
+            if on_error is not None:
+                self.post(on_error, err)
+            else:
+                print(f"Błąd zadania: {err}")
+        elif on_done is not None:
+            self.post(on_done, fut.result())
+
+    def poll(self, budget=POLL_BUDGET):
+        # Called on the Tk thread; runs at most `budget` callbacks so a burst can't stall a frame
+        for _ in range(budget):
+            try:
+                fn, args = self._results.get_nowait()
+            except queue.Empty:
+                break
+            fn(*args)
+
+    def is_running(self, key):
+        return key in self._running
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,345 @@
+# thoughts.py
+# Wymiana myśli między Muminkami – stałe połączenia i ramki z nagłówkiem (dtype, kształt)
+#
+# Frame: MAGIC | uint8 version | 8s dtype.str | uint8 ndim | uint16 sender | ndim × uint32 shape | payload
+#
+# `sender` is the port the sending Muminek listens on (0 if it does not listen): together
+# with the connection's host it names the peer across reconnects and on a shared host.
+
+import asyncio
+import os
+import queue
+import socket
+import struct
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+# ─── Constants ──────────────────────────────────────────────────────────────
+MAGIC            = b"MUMT"
+FRAME_VERSION    = 2
+HEADER           = struct.Struct("<4sB8sBH")
+DIM              = struct.Struct("<I")
+MAX_FRAME_BYTES  = 256 * 1024 * 1024
+CONNECT_TIMEOUT  = 1.0
+RETRY_DELAY      = 1.0
+INBOX_SIZE       = 64
+THOUGHT_PORT     = 5007
+# "host:port,host:port" – replaces the hard-coded 192.168.1.15
+PEERS_ENV        = "MUMINKI_PEERS"
+
+
+# ─── Frames ─────────────────────────────────────────────────────────────────
+def encode_frame(arr, sender=0):
+    arr = np.ascontiguousarray(arr)
+    dims = b"".join(DIM.pack(d) for d in arr.shape)
+    return HEADER.pack(MAGIC, FRAME_VERSION, arr.dtype.str.encode(), arr.ndim, sender) + dims + arr.tobytes()
+
+def recv_exact(sock, n):
+    buf = bytearray(n)
+    view = memoryview(buf)
+    got = 0
+    while got < n:
+        k = sock.recv_into(view[got:])
+        if k == 0:
+            raise ConnectionError("Połączenie zamknięte")
+        got += k
+    return buf
+
+def parse_header(raw):
+    magic, version, dtype, ndim, sender = HEADER.unpack(raw)
+    if magic != MAGIC or version != FRAME_VERSION:
+        raise ValueError("Nieprawidłowa ramka myśli")
+    try:
+        dtype = np.dtype(dtype.rstrip(b"\0").decode())
+    except TypeError:
+        # Unknown type strings raise TypeError; handle() only expects ValueError from a bad frame
+        raise ValueError("Nieznany typ danych w ramce") from None
+    if dtype.hasobject:
+        raise ValueError("Nieprawidłowy typ danych w ramce")
+    return dtype, ndim, sender
+
+def parse_shape(raw, dtype):
+    shape = tuple(d for (d,) in DIM.iter_unpack(raw))
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    if nbytes > MAX_FRAME_BYTES:
+        raise ValueError(f"Ramka za duża: {nbytes} B")
+    return shape, nbytes
+
+def read_frame(sock):
+    # (array, sender port)
+    dtype, ndim, sender = parse_header(recv_exact(sock, HEADER.size))
+    shape, nbytes = parse_shape(recv_exact(sock, ndim * DIM.size), dtype)
+    return np.frombuffer(recv_exact(sock, nbytes), dtype=dtype).reshape(shape), sender
+
+async def read_frame_async(reader):
+    dtype, ndim, sender = parse_header(await reader.readexactly(HEADER.size))
+    shape, nbytes = parse_shape(await reader.readexactly(ndim * DIM.size), dtype)
+    return np.frombuffer(await reader.readexactly(nbytes), dtype=dtype).reshape(shape), sender
+
+def parse_peers(spec=None):
+    spec = os.environ.get(PEERS_ENV, "") if spec is None else spec
+    peers = []
+    for item in spec.replace(";", ",").split(","):
+        item = item.strip()
+        if item:
+            host, _, port = item.rpartition(":")
+            peers.append((host or "127.0.0.1", int(port)))
+    return peers
+
+
+# ─── Sending ────────────────────────────────────────────────────────────────
+class Connector:
+    # One background thread opens peer connections, so broadcast() never waits on a handshake:
+    # a link without a socket drops frames until the connector hands it one
+    def __init__(self, timeout=CONNECT_TIMEOUT):
+        self.timeout = timeout
+        self._queue  = queue.SimpleQueue()
+        self._lock   = threading.Lock()
+        self._thread = None
+
+    def request(self, link):
+        with self._lock:
+            if link.connecting:
+                return
+            link.connecting = True
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._worker, daemon=True)
+                self._thread.start()
+        self._queue.put(link)
+
+    def _worker(self):
+        while True:
+            link = self._queue.get()
+            if link is None:
+                return
+            try:
+                link.connect(self.timeout)
+            except OSError:
+                link.retry_at = time.monotonic() + RETRY_DELAY
+            finally:
+                link.connecting = False
+
+    def close(self):
+        if self._thread is not None:
+            self._queue.put(None)
+
+
+class PeerLink:
+    def __init__(self, host, port, connector=None):
+        self.addr       = (host, port)
+        self.connector  = connector
+        self.sock       = None
+        self.retry_at   = 0.0
+        self.connecting = False
+        self.closed     = False
+        self.sent       = 0
+        self.dropped    = 0
+        # Unsent tail of the last frame; a frame is never interleaved with the next one
+        self._out       = None
+
+    def connect(self, timeout=CONNECT_TIMEOUT):
+        # Blocking handshake; ThoughtSender runs it on its Connector thread
+        s = socket.create_connection(self.addr, timeout=timeout)
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        s.setblocking(False)
+        if self.closed:
+            s.close()
+            return
+        self._out = None
+        self.sock = s
+
+    def close(self):
+        self.closed = True
+        self._drop()
+
+    def _drop(self):
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+            self.sock = None
+        self._out = None
+
+    def _flush(self):
+        # Writes as much of the pending frame as the socket takes without blocking
+        while self._out:
+            try:
+                k = self.sock.send(self._out)
+            except BlockingIOError:
+                return
+            self._out = self._out[k:]
+        self._out = None
+
+    def send(self, frame):
+        # Never blocks: without a connection the frame is dropped (and a connect is queued,
+        # at most once per RETRY_DELAY); a peer still reading the previous frame drops this one
+        if self.sock is None:
+            self.dropped += 1
+            if not self.closed and time.monotonic() >= self.retry_at:
+                if self.connector is None:
+                    self.connector = Connector()
+                self.connector.request(self)
+            return False
+        try:
+            self._flush()
+            if self._out:
+                self.dropped += 1
+                return False
+            self._out = memoryview(frame)
+            self._flush()
+            self.sent += 1
+            return True
+        except OSError:
+            self._drop()
+            self.retry_at = time.monotonic() + RETRY_DELAY
+            self.dropped += 1
+            return False
+
+
+class ThoughtSender:
+    # port: where this Muminek's ThoughtServer listens, sent in every frame as its identity
+    def __init__(self, peers=None, port=0):
+        self.port      = port
+        self.connector = Connector()
+        self.links     = [PeerLink(h, p, self.connector) for h, p in (parse_peers() if peers is None else peers)]
+
+    def broadcast(self, arr):
+        if not self.links:
+            return 0
+        frame = encode_frame(arr, self.port)
+        return sum(link.send(frame) for link in self.links)
+
+    def close(self):
+        for link in self.links:
+            link.close()
+        self.connector.close()
+
+
+# ─── Receiving ──────────────────────────────────────────────────────────────
+def sender_id(peername, sender=0):
+    # asyncio peernames are (host, port, ...) with an ephemeral port that changes on reconnect;
+    # the advertised listen port does not, and tells apart Muminki sharing one host
+    host = peername[0] if isinstance(peername, tuple) and peername else peername
+    return (host, sender) if sender else host
+
+
+class RateLimiter:
+    # Token bucket per peer: `rate` frames per second, bursts up to `burst`. Peers are
+    # sender_id()s, so a reconnect does not get a fresh bucket.
+    def __init__(self, rate, burst=None):
+        self.rate     = rate
+        self.burst    = burst or max(1.0, rate)
+        # A bucket idle this long has refilled completely and is the same as no bucket
+        self.idle     = self.burst / rate
+        self._buckets = {}
+        self._prune_at = 0.0
+
+    def allow(self, peer, now=None):
+        now = time.monotonic() if now is None else now
+        tokens, last = self._buckets.get(peer, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - last) * self.rate)
+        ok = tokens >= 1
+        self._buckets[peer] = (tokens - 1 if ok else tokens, now)
+        if now >= self._prune_at:
+            self.prune(now)
+        return ok
+
+    def prune(self, now=None):
+        now = time.monotonic() if now is None else now
+        stale = [p for p, (_, last) in self._buckets.items() if now - last >= self.idle]
+        for p in stale:
+            del self._buckets[p]
+        self._prune_at = now + self.idle
+        return len(stale)
+
+    def __len__(self):
+        return len(self._buckets)
+
+
+class ThoughtInbox:
+    # Bounded hand-off between the network and the simulation. Frames from the same
+    # peer coalesce (newest wins); past maxsize peers the oldest pending one is dropped.
+    def __init__(self, maxsize=INBOX_SIZE, rate=None, burst=None):
+        self.maxsize  = maxsize
+        self.limiter  = RateLimiter(rate, burst) if rate else None
+        self.received = 0
+        self.merged   = 0
+        self.dropped  = 0
+        self.limited  = 0
+        self._pending = OrderedDict()
+        self._lock    = threading.Lock()
+
+    def put(self, arr, peer=None):
+        with self._lock:
+            self.received += 1
+            if self.limiter is not None and not self.limiter.allow(peer):
+                self.limited += 1
+                return
+            if peer in self._pending:
+                self.merged += 1
+                del self._pending[peer]
+            elif len(self._pending) >= self.maxsize:
+                self._pending.popitem(last=False)
+                self.dropped += 1
+            self._pending[peer] = arr
+
+    def drain(self):
+        with self._lock:
+            items, self._pending = list(self._pending.items()), OrderedDict()
+        return items
+
+    def __len__(self):
+        return len(self._pending)
+
+
+class ThoughtServer:
+    # asyncio accept/read loop on its own thread; many peers, no thread per peer
+    def __init__(self, on_thought, host="0.0.0.0", port=THOUGHT_PORT):
+        self.on_thought = on_thought
+        self.received   = 0
+        self.peers      = 0
+        self.loop       = asyncio.new_event_loop()
+        self._writers   = set()
+        self._thread    = None
+        self.server     = self.loop.run_until_complete(asyncio.start_server(self.handle, host, port))
+        self.port       = self.server.sockets[0].getsockname()[1]
+
+    def start(self):
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    async def handle(self, reader, writer):
+        peername = writer.get_extra_info("peername")
+        self.peers += 1
+        self._writers.add(writer)
+        try:
+            while True:
+                arr, sender = await read_frame_async(reader)
+                self.received += 1
+                self.on_thought(arr, sender_id(peername, sender))
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError, OSError):
+            pass
+        finally:
+            self.peers -= 1
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _shutdown(self):
+        self.server.close()
+        for writer in list(self._writers):
+            writer.close()
+        await self.server.wait_closed()
+
+    def close(self):
+        if self._thread is None:
+            self.loop.run_until_complete(self._shutdown())
+        else:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop).result(timeout=5)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+        self.loop.close()